@@ -1,20 +1,94 @@
 import os
-import base64
+import argparse
 import json
-from omnidimension import Client
-
-# Initialize the OmniDimension client
-api_key = os.environ.get('OMNIDIM_API_KEY', 'YBNmK6VxNLnPkIxwRNbZBKFR5C6_sRP0sSUFZeMr4p8')
-# production 
-client = Client(api_key)
-# staging
-client = Client(api_key, base_url='https://dashboard.staging.omnidim.io/api/v1/')
+import asyncio
+import functools
+import logging
+from omnidimension import Client, AsyncClient, APIError
+
+log = logging.getLogger('omnidim.example')
+
+# Log response payloads; set with -v/--verbose or OMNIDIM_VERBOSE=1
+VERBOSE = os.environ.get('OMNIDIM_VERBOSE') == '1'
+
+# The client is built on first use, so importing this module does no setup work
+@functools.lru_cache(maxsize=1)
+def get_client():
+    """Return the shared OmniDimension client"""
+    base_url = os.environ.get('OMNIDIM_BASE_URL')
+    if base_url:
+        return Client(os.environ['OMNIDIM_API_KEY'], base_url=base_url)
+    return Client(os.environ['OMNIDIM_API_KEY'])
+
+# Default agent configurations, built once and shared by every create call
+DEFAULT_TRANSCRIBER = {
+    "provider": "deepgram_stream",
+    "silence_timeout_ms": 400
+}
+
+DEFAULT_MODEL = {
+    "model": "gpt-4o-mini",
+    "temperature": 0.7
+}
+
+DEFAULT_VOICE = {
+    "provider": "eleven_labs",
+    "voice_id": "JBFqnCBsd6RMkjVDRZzb"
+}
+
+DEFAULT_WEB_SEARCH = {
+    "enabled": True,
+    "provider": "DuckDuckGo"
+}
+
+DEFAULT_FILLER = {
+    "enabled": True,
+    "after_sec": 0,
+    "fillers": ['let me check'],
+}
+
+# Integration data for creating an integration from JSON (built once at import)
+CRM_INTEGRATION_DATA = {
+    "name": "CRM API Integration",
+    "description": "Integration with CRM service",
+    "url": "https://api.crm-example.com/v1/contacts",
+    "method": "POST",
+    "integration_type": "custom_api",
+    "headers": [
+        {"key": "Authorization", "value": "Bearer token123"},
+        {"key": "Content-Type", "value": "application/json"}
+    ],
+    "body_type": "json",
+    "body_params": [
+        {
+            "key": "name",
+            "description": "Contact name",
+            "type": "string",
+            "required": True,
+            "isLLMGenerated": True
+        },
+        {
+            "key": "email",
+            "description": "Contact email",
+            "type": "string",
+            "required": True,
+            "isLLMGenerated": True
+        },
+        {
+            "key": "phone",
+            "description": "Contact phone number",
+            "type": "string",
+            "required": False,
+            "isLLMGenerated": True
+        }
+    ]
+}
 
 # ===== Example Usage Functions =====
 
 def run_agent_examples():
     """Run examples for agent operations"""
-    print("\n===== RUNNING AGENT EXAMPLES =====\n")
+    log.info("===== RUNNING AGENT EXAMPLES =====")
     
     # List agents
     agents_data = list_agents()
@@ -55,171 +129,165 @@ def run_agent_examples():
 
 def run_call_log_examples():
     """Run examples for call log operations"""
-    print("\n===== RUNNING CALL LOG EXAMPLES =====\n")
+    log.info("===== RUNNING CALL LOG EXAMPLES =====")
     
-    # Get call logs
-    call_logs = get_call_logs()
+    # Only the first call log is needed, so fetch a single record with its detail inlined
+    first_log = next(get_client().call.iter_call_logs(page_size=1, expand='detail'), None)
     
-    # Get details of the first call log if available
-    if call_logs.get('call_log_data') and len(call_logs['call_log_data']) > 0:
-        call_log_id = call_logs['call_log_data'][0]['id']
-        get_call_log_details(call_log_id)
+    if first_log:
+        detail = first_log.get('detail')
+        if detail:
+            print_json_response(detail, f"Call log details (ID: {first_log['id']})")
+        else:
+            # Server didn't expand the record, fall back to a detail request
+            get_call_log_details(first_log['id'])
     else:
-        print("No call logs found.")
+        log.info("No call logs found.")
     
     # Uncomment to dispatch a call
     # agents_data = list_agents()
     # if agents_data.get('bots') and len(agents_data['bots']) > 0:
     #     agent_id = agents_data['bots'][0]['id']
     #     dispatch_call(agent_id, '+1234567890')
+    #     # or dial several numbers at once
+    #     dispatch_calls(agent_id, ['+1234567890', '+1987654321'])
 
-def run_integration_examples():
+async def run_integration_examples():
     """Run examples for integration operations"""
-    print("\n===== RUNNING INTEGRATION EXAMPLES =====\n")
-    
-    # Get integration format examples
-    get_integration_format_examples()
-    
-    # Get user integrations
-    get_user_integrations()
-    
-    # Create a custom API integration
-    api_integration = create_custom_api_integration(
-        name="Weather API Integration",
-        description="Integration with weather service",
-        url="https://api.weatherapi.com/v1/current.json",
-        method="GET",
-        headers=[
-            {"key": "Content-Type", "value": "application/json"}
-        ],
-        query_params=[
-            
-            {
-                "key": "q",
-                "description": "Location query",
-                "type": "string",
-                "required": True,
-                "isLLMGenerated": True
-            }
-        ]
-    )
-    
-    # Create a Cal.com integration
-    cal_integration = create_cal_integration(
-        name="Meeting Scheduler Integration",
-        description="Integration with Cal.com calendar",
-        cal_api_key="cal_api_key_example",
-        cal_id="cal_user_id_example",
-        cal_timezone="America/New_York"
-    )
+    log.info("===== RUNNING INTEGRATION EXAMPLES =====")
     
-    # Create integration from JSON
-    integration_data = {
-        "name": "CRM API Integration",
-        "description": "Integration with CRM service",
-        "url": "https://api.crm-example.com/v1/contacts",
-        "method": "POST",
-        "integration_type": "custom_api",
-        "headers": [
-            {"key": "Authorization", "value": "Bearer token123"},
-            {"key": "Content-Type", "value": "application/json"}
-        ],
-        "body_type": "json",
-        "body_params": [
-            {
-                "key": "name",
-                "description": "Contact name",
-                "type": "string",
-                "required": True,
-                "isLLMGenerated": True
-            },
-            {
-                "key": "email",
-                "description": "Contact email",
-                "type": "string",
-                "required": True,
-                "isLLMGenerated": True
-            },
-            {
-                "key": "phone",
-                "description": "Contact phone number",
-                "type": "string",
-                "required": False,
-                "isLLMGenerated": True
-            }
-        ]
-    }
-    json_integration = create_integration_from_json(integration_data)
+    client = get_client()
+    async with AsyncClient(client.api_key, base_url=client.base_url) as async_client:
+        # None of these depend on each other, so run them concurrently
+        (format_examples, user_integrations, api_integration,
+         cal_integration, json_integration, agent_data) = await asyncio.gather(
+            async_client.integrations.get_integration_format_examples(),
+            async_client.integrations.get_user_integrations(),
+            async_client.integrations.create_custom_api_integration(
+                name="Weather API Integration",
+                description="Integration with weather service",
+                url="https://api.weatherapi.com/v1/current.json",
+                method="GET",
+                headers=[
+                    {"key": "Content-Type", "value": "application/json"}
+                ],
+                query_params=[
+                    {
+                        "key": "q",
+                        "description": "Location query",
+                        "type": "string",
+                        "required": True,
+                        "isLLMGenerated": True
+                    }
+                ],
+                body_params=[]
+            ),
+            async_client.integrations.create_cal_integration(
+                name="Meeting Scheduler Integration",
+                description="Integration with Cal.com calendar",
+                cal_api_key="cal_api_key_example",
+                cal_id="cal_user_id_example",
+                cal_timezone="America/New_York"
+            ),
+            async_client.integrations.create_integration_from_json(CRM_INTEGRATION_DATA),
+            async_client.agent.create(
+                name="Integration Test Agent",
+                welcome_message="Hello! I'm an agent for testing integrations.",
+                context_breakdown=[
+                    {"title": "Purpose", "body": "This agent demonstrates integration capabilities."}
+                ]
+            ),
+        )
     
-    # Create an agent for integration examples
-    agent_data = create_agent(
-        name="Integration Test Agent",
-        welcome_message="Hello! I'm an agent for testing integrations.",
-        context_breakdown=[
-            {"title": "Purpose", "body": "This agent demonstrates integration capabilities."}
-        ]
-    )
+    print_json_response(format_examples, "Getting integration format examples")
+    print_json_response(user_integrations, "Getting user integrations")
+    print_json_response(api_integration, "Creating custom API integration: Weather API Integration")
+    print_json_response(cal_integration, "Creating Cal.com integration: Meeting Scheduler Integration")
+    print_json_response(json_integration, f"Creating integration from JSON: {CRM_INTEGRATION_DATA['name']}")
+    print_json_response(agent_data, "Creating agent: Integration Test Agent")
     
     # Get the agent ID and integration ID
     agent_id = agent_data.get('id')
     api_integration_id = api_integration.get('id')
     
     if agent_id and api_integration_id:
-        # Add integration to agent
-        add_integration_to_agent(agent_id, api_integration_id)
-        
-        # Get agent integrations
-        get_agent_integrations(agent_id)
+        # These steps depend on each other, so the batch runs them in order
+        # over the same warm connection
+        batch = client.batch()
+        batch.add(client.integrations.add_integration_to_agent, agent_id=agent_id, integration_id=api_integration_id)
+        batch.add(client.integrations.get_agent_integrations, agent_id)
+        batch.add(client.integrations.remove_integration_from_agent, agent_id=agent_id, integration_id=api_integration_id)
+        added, agent_integrations, removed = batch.execute()
         
-        # Remove integration from agent
-        remove_integration_from_agent(agent_id, api_integration_id)
+        print_json_response(added, f"Adding integration (ID: {api_integration_id}) to agent (ID: {agent_id})")
+        print_json_response(agent_integrations, f"Getting integrations for agent (ID: {agent_id})")
+        print_json_response(removed, f"Removing integration (ID: {api_integration_id}) from agent (ID: {agent_id})")
 
 def run_knowledge_base_examples():
     """Run examples for knowledge base operations"""
-    print("\n===== RUNNING KNOWLEDGE BASE EXAMPLES =====\n")
-    
-    # List all knowledge base files
-    list_knowledge_base_files()
+    log.info("===== RUNNING KNOWLEDGE BASE EXAMPLES =====")
     
-    # Check if a file can be uploaded (1MB file)
-    check_file_upload_capability(1024 * 1024)
+    # Use the real size of sample.pdf for the upload check, if it exists
+    try:
+        file_size = os.path.getsize("sample.pdf")
+    except FileNotFoundError:
+        file_size = None
     
+    # These lookups are independent, so run them concurrently on the client's thread pool
+    client = get_client()
+    files_future = client.submit(list_knowledge_base_files)
+    upload_check_future = None
+    if file_size is not None:
+        upload_check_future = client.submit(check_file_upload_capability, file_size)
     # Get an agent ID for attaching files
-    agents_data = list_agents()
-    agent_id = agents_data.get('bots', [{}])[0].get('id') if agents_data.get('bots') and len(agents_data['bots']) > 0 else None
+    agents_future = client.submit(list_agents)
+    files_future.result()
+    agents_data = agents_future.result()
+    agents = agents_data.get('json', {}).get('bots')
+    agent_id = agents[0].get('id') if agents else None
     
-    # Upload a file if sample.pdf exists
+    if upload_check_future is None:
+        log.info("sample.pdf not found. Skipping file upload examples.")
+        return
     try:
-        file_data = upload_file_to_knowledge_base("sample.pdf")
-        file_id = file_data.get('file', {}).get('id')
+        upload_check_future.result()
+    except APIError as e:
+        # Don't send a file the server has already refused
+        log.info("sample.pdf (%d bytes) can't be uploaded: %s", file_size, e.message)
+        return
+    
+    # Upload sample.pdf
+    file_data = upload_file_to_knowledge_base("sample.pdf")
+    file_id = file_data.get('json', {}).get('file', {}).get('id')
+    
+    if file_id and agent_id:
+        # Attach file to agent
+        attach_files_to_agent([file_id], agent_id)
         
-        if file_id and agent_id:
-            # Attach file to agent
-            attach_files_to_agent([file_id], agent_id)
-            
-            # Detach file from agent
-            detach_files_from_agent([file_id], agent_id)
-            
-            # Delete file from knowledge base
-            delete_file_from_knowledge_base(file_id)
-    except FileNotFoundError:
-        print("sample.pdf not found. Skipping file upload examples.")
+        # Detach file from agent
+        detach_files_from_agent([file_id], agent_id)
+        
+        # Delete file from knowledge base
+        delete_file_from_knowledge_base(file_id)
 
 def run_phone_number_examples():
     """Run examples for phone number operations"""
-    print("\n===== RUNNING PHONE NUMBER EXAMPLES =====\n")
+    log.info("===== RUNNING PHONE NUMBER EXAMPLES =====")
     
-    # List all phone numbers
-    phone_numbers = list_phone_numbers()
+    # List all phone numbers and agents concurrently; neither depends on the other
+    client = get_client()
+    phone_numbers_future = client.submit(list_phone_numbers)
+    agents_future = client.submit(list_agents)
+    phone_numbers = phone_numbers_future.result()
+    agents_data = agents_future.result()
     
     # Get an agent ID
-    agents_data = list_agents()
-    agent_id = agents_data.get('bots', [{}])[0].get('id') if agents_data.get('bots') and len(agents_data['bots']) > 0 else None
+    agents = agents_data.get('json', {}).get('bots')
+    agent_id = agents[0].get('id') if agents else None
     
     # Get the first phone number ID if available
-    phone_number_id = None
-    if phone_numbers.get('phone_numbers') and len(phone_numbers['phone_numbers']) > 0:
-        phone_number_id = phone_numbers['phone_numbers'][0]['id']
+    numbers = phone_numbers.get('json', {}).get('phone_numbers')
+    phone_number_id = numbers[0]['id'] if numbers else None
     
     if phone_number_id and agent_id:
         # Attach phone number to agent
@@ -229,24 +297,25 @@ def run_phone_number_examples():
         detach_phone_number(phone_number_id)
 
 
-# Helper function to pretty print JSON responses
+# Helper function to log JSON responses
 def print_json_response(response, title=None):
-    """Pretty print JSON responses"""
+    """Log JSON responses at DEBUG level; serialization is skipped when DEBUG is off"""
+    if not log.isEnabledFor(logging.DEBUG):
+        return response
+    
     if title:
-        print(f"\n=== {title} ===\n")
+        log.debug("=== %s ===", title)
     
     if isinstance(response, dict):
         status = response.get('status')
         if status:
-            print(f"Status: {status}")
+            log.debug("Status: %s", status)
         
-        json_data = response.get('json')
-        if json_data:
-            print(json.dumps(json_data, indent=2))
-        else:
-            print(json.dumps(response, indent=2))
+        # Dump only the payload when there is one, never the payload and the whole response
+        payload = response.get('json') or response
     else:
-        print(json.dumps(response, indent=2))
+        payload = response
+    log.debug("%s", json.dumps(payload, indent=2))
     
     return response
 
@@ -254,12 +323,12 @@ def print_json_response(response, title=None):
 
 def list_agents(page=1, page_size=10):
     """List all agents with pagination"""
-    response = client.agent.list(page=page, page_size=page_size)
+    response = get_client().agent.list(page=page, page_size=page_size)
     return print_json_response(response, "Listing all agents")
 
 def create_agent(name, welcome_message, context_breakdown):
     """Create a new agent with basic configuration"""
-    response = client.agent.create(
+    response = get_client().agent.create(
         name=name,
         welcome_message=welcome_message,
         context_breakdown=context_breakdown
@@ -269,39 +338,23 @@ def create_agent(name, welcome_message, context_breakdown):
 def create_agent_with_full_config(name, welcome_message, context_breakdown, transcriber=None, model=None, 
                                 voice=None, web_search=None, post_call_actions=None, filler=None):
     """Create a new agent with full configuration options"""
-    # Set default configurations if not provided
+    # Fall back to the shared default configurations if not provided
     if transcriber is None:
-        transcriber = {
-            "provider": "deepgram_stream",
-            "silence_timeout_ms": 400
-        }
+        transcriber = DEFAULT_TRANSCRIBER
     
     if model is None:
-        model = {
-            "model": "gpt-4o-mini",
-            "temperature": 0.7
-        }
+        model = DEFAULT_MODEL
     
     if voice is None:
-        voice = {
-            "provider": "eleven_labs",
-            "voice_id": "JBFqnCBsd6RMkjVDRZzb"
-        }
+        voice = DEFAULT_VOICE
     
     if web_search is None:
-        web_search = {
-            "enabled": True,
-            "provider": "DuckDuckGo"
-        }
+        web_search = DEFAULT_WEB_SEARCH
     
     if filler is None:
-        filler = {
-            "enabled": True,
-            "after_sec": 0,
-            "fillers": ['let me check'],
-        }
+        filler = DEFAULT_FILLER
     
-    response = client.agent.create(
+    response = get_client().agent.create(
         name=name,
         welcome_message=welcome_message,
         context_breakdown=context_breakdown,
@@ -316,51 +369,61 @@ def create_agent_with_full_config(name, welcome_message, context_breakdown, tran
 
 def get_agent(agent_id):
     """Get details of a specific agent"""
-    response = client.agent.get(agent_id)
+    response = get_client().agent.get(agent_id)
     return print_json_response(response, f"Getting agent details (ID: {agent_id})")
 
 def update_agent(agent_id, update_data):
     """Update an existing agent"""
-    response = client.agent.update(agent_id, update_data)
+    response = get_client().agent.update(agent_id, update_data)
     return print_json_response(response, f"Updating agent (ID: {agent_id})")
 
 def delete_agent(agent_id):
     """Delete an agent"""
-    response = client.agent.delete(agent_id)
+    response = get_client().agent.delete(agent_id)
     return print_json_response(response, f"Deleting agent (ID: {agent_id})")
 
 # ===== Call Log Operations =====
 
-def get_call_logs(page=1, page_size=10):
+def get_call_logs(page=1, page_size=10, expand=None):
     """Get all call logs with pagination"""
-    response = client.call.get_call_logs(page=page, page_size=page_size)
+    response = get_client().call.get_call_logs(page=page, page_size=page_size, expand=expand)
     return print_json_response(response, "Getting call logs")
 
 def get_call_log_details(call_log_id):
     """Get details of a specific call log"""
-    response = client.call.get_call_log(call_log_id=call_log_id)
+    response = get_client().call.get_call_log(call_log_id=call_log_id)
     return print_json_response(response, f"Getting call log details (ID: {call_log_id})")
 
 def dispatch_call(agent_id, to_number):
     """Dispatch a call to a specific number using an agent"""
-    response = client.call.dispatch_call(agent_id=agent_id, to_number=to_number)
+    response = get_client().call.dispatch_call(agent_id=agent_id, to_number=to_number)
     return print_json_response(response, f"Dispatching call to {to_number} using agent {agent_id}")
 
+def dispatch_calls(agent_id, to_numbers):
+    """Dispatch calls to several numbers concurrently using an agent"""
+    responses = get_client().call.dispatch_calls(agent_id, to_numbers, return_exceptions=True)
+    for to_number, response in zip(to_numbers, responses):
+        if isinstance(response, Exception):
+            log.error("Dispatching call to %s failed: %s", to_number, response)
+        else:
+            print_json_response(response, f"Dispatching call to {to_number} using agent {agent_id}")
+    return dict(zip(to_numbers, responses))
+
 # ===== Integration Operations =====
 
 def get_integration_format_examples():
     """Get examples of integration formats"""
-    response = client.integrations.get_integration_format_examples()
+    response = get_client().integrations.get_integration_format_examples()
     return print_json_response(response, "Getting integration format examples")
 
 def get_user_integrations():
     """Get all integrations for the current user"""
-    response = client.integrations.get_user_integrations()
+    response = get_client().integrations.get_user_integrations()
     return print_json_response(response, "Getting user integrations")
 
 def create_custom_api_integration(name, description, url, method, headers=None, query_params=None, body_params=None):
     """Create a custom API integration"""
-    response = client.integrations.create_custom_api_integration(
+    response = get_client().integrations.create_custom_api_integration(
         name=name,
         description=description,
         url=url,
@@ -373,7 +436,7 @@ def create_custom_api_integration(name, description, url, method, headers=None,
 
 def create_cal_integration(name, description, cal_api_key, cal_id, cal_timezone):
     """Create a Cal.com integration"""
-    response = client.integrations.create_cal_integration(
+    response = get_client().integrations.create_cal_integration(
         name=name,
         description=description,
         cal_api_key=cal_api_key,
@@ -384,12 +447,12 @@ def create_cal_integration(name, description, cal_api_key, cal_id, cal_timezone)
 
 def create_integration_from_json(integration_data):
     """Create an integration from a JSON configuration"""
-    response = client.integrations.create_integration_from_json(integration_data)
+    response = get_client().integrations.create_integration_from_json(integration_data)
     return print_json_response(response, f"Creating integration from JSON: {integration_data.get('name')}")
 
 def add_integration_to_agent(agent_id, integration_id):
     """Add an integration to an agent"""
-    response = client.integrations.add_integration_to_agent(
+    response = get_client().integrations.add_integration_to_agent(
         agent_id=agent_id,
         integration_id=integration_id
     )
@@ -397,12 +460,12 @@ def add_integration_to_agent(agent_id, integration_id):
 
 def get_agent_integrations(agent_id):
     """Get all integrations for a specific agent"""
-    response = client.integrations.get_agent_integrations(agent_id)
+    response = get_client().integrations.get_agent_integrations(agent_id)
     return print_json_response(response, f"Getting integrations for agent (ID: {agent_id})")
 
 def remove_integration_from_agent(agent_id, integration_id):
     """Remove an integration from an agent"""
-    response = client.integrations.remove_integration_from_agent(
+    response = get_client().integrations.remove_integration_from_agent(
         agent_id=agent_id,
         integration_id=integration_id
     )
@@ -412,12 +475,12 @@ def remove_integration_from_agent(agent_id, integration_id):
 
 def list_knowledge_base_files():
     """List all knowledge base files"""
-    response = client.knowledge_base.list()
+    response = get_client().knowledge_base.list()
     return print_json_response(response, "Listing all knowledge base files")
 
 def check_file_upload_capability(file_size):
     """Check if a file of the given size can be uploaded"""
-    response = client.knowledge_base.can_upload(file_size)
+    response = get_client().knowledge_base.can_upload(file_size)
     return print_json_response(response, f"Checking if a file of size {file_size} bytes can be uploaded")
 
 def upload_file_to_knowledge_base(file_path, file_name=None):
@@ -425,50 +488,60 @@ def upload_file_to_knowledge_base(file_path, file_name=None):
     if file_name is None:
         file_name = os.path.basename(file_path)
     
-    with open(file_path, "rb") as file:
-        file_data = base64.b64encode(file.read()).decode('utf-8')
-    
-    response = client.knowledge_base.create(file_data, file_name)
+    # Streams the file, base64-encoding it chunk by chunk instead of reading it all at once
+    response = get_client().knowledge_base.create_stream(file_path, file_name)
     return print_json_response(response, f"Uploading file: {file_name}")
 
 def attach_files_to_agent(file_ids, agent_id):
     """Attach files to an agent"""
-    response = client.knowledge_base.attach(file_ids, agent_id)
+    response = get_client().knowledge_base.attach(file_ids, agent_id)
     return print_json_response(response, f"Attaching files to agent (ID: {agent_id})")
 
 def detach_files_from_agent(file_ids, agent_id):
     """Detach files from an agent"""
-    response = client.knowledge_base.detach(file_ids, agent_id)
+    response = get_client().knowledge_base.detach(file_ids, agent_id)
     return print_json_response(response, f"Detaching files from agent (ID: {agent_id})")
 
 def delete_file_from_knowledge_base(file_id):
     """Delete a file from the knowledge base"""
-    response = client.knowledge_base.delete(file_id)
+    response = get_client().knowledge_base.delete(file_id)
     return print_json_response(response, f"Deleting file from knowledge base (ID: {file_id})")
 
 # ===== Phone Number Operations =====
 
 def list_phone_numbers(page=1, page_size=10):
     """List all phone numbers with pagination"""
-    response = client.phone_number.list(page=page, page_size=page_size)
+    response = get_client().phone_number.list(page=page, page_size=page_size)
     return print_json_response(response, "Listing all phone numbers")
 
 def attach_phone_number_to_agent(phone_number_id, agent_id):
     """Attach a phone number to an agent"""
-    response = client.phone_number.attach(phone_number_id, agent_id)
+    response = get_client().phone_number.attach(phone_number_id, agent_id)
     return print_json_response(response, f"Attaching phone number (ID: {phone_number_id}) to agent (ID: {agent_id})")
 
 def detach_phone_number(phone_number_id):
     """Detach a phone number from its associated agent"""
-    response = client.phone_number.detach(phone_number_id)
+    response = get_client().phone_number.detach(phone_number_id)
     return print_json_response(response, f"Detaching phone number (ID: {phone_number_id})")
 
 
 if __name__ == "__main__":
-    # Uncomment the function you want to run
-    # run_agent_examples()
-    # run_call_log_examples()
-    # run_integration_examples()
-    run_knowledge_base_examples()
-    # run_phone_number_examples()
-
+    examples = {
+        'agent': run_agent_examples,
+        'call': run_call_log_examples,
+        'integrations': lambda: asyncio.run(run_integration_examples()),
+        'kb': run_knowledge_base_examples,
+        'phone': run_phone_number_examples,
+    }
+    parser = argparse.ArgumentParser(description="Run OmniDimension SDK examples")
+    parser.add_argument('example', nargs='?', default='kb', choices=examples,
+                        help="which example to run (default: kb)")
+    parser.add_argument('-v', '--verbose', action='store_true', default=VERBOSE,
+                        help="log every response payload (or set OMNIDIM_VERBOSE=1)")
+    args = parser.parse_args()
+    VERBOSE = args.verbose
+    
+    # Response payloads are only serialized when they are logged, i.e. in verbose mode
+    default_level = 'DEBUG' if VERBOSE else 'INFO'
+    logging.basicConfig(level=os.environ.get('OMNIDIM_LOG_LEVEL', default_level), format='%(message)s')
+    examples[args.example]()
@@ -1,11 +1,16 @@
 
+import functools
+import importlib.util
 import logging
-from re import T
-from typing import Optional, Dict, List, TypedDict
+import os
+from typing import TYPE_CHECKING, Dict, List
 
 from fastmcp import FastMCP
-from omnidimension import Client
-import os
+# pydantic only accepts typing_extensions.TypedDict before Python 3.12
+from typing_extensions import TypedDict
+
+if TYPE_CHECKING:
+    from omnidimension import AsyncClient
 
 logger = logging.getLogger(__name__)
 
@@ -17,7 +22,7 @@ class TContextBreakdown(TypedDict):
 
 
 @mcp.tool(description="for creating a new assistant")
-def dispatch_a_call(assistant_id: int, to_number: str, call_context: dict) -> Dict:
+async def dispatch_a_call(assistant_id: int, to_number: str, call_context: dict) -> Dict:
     """
     Dispatch a call to given number
     params: 
@@ -27,11 +32,11 @@ def dispatch_a_call(assistant_id: int, to_number: str, call_context: dict) -> Di
     Returns: 
         - success 
     """
-    return get_client().call.dispatch_call(agent_id=assistant_id, call_context=call_context, to_number=to_number)
+    return await get_async_client().call.dispatch_call(agent_id=assistant_id, call_context=call_context, to_number=to_number)
 
 
 @mcp.tool(description="for creating a new assistant")
-def create_assistant(name: str, context_breakdown: List[TContextBreakdown], welcome_message: str) -> Dict:
+async def create_assistant(name: str, context_breakdown: List[TContextBreakdown], welcome_message: str) -> Dict:
     """
     params: 
     assistant_id: id of the assistant
@@ -44,11 +49,12 @@ def create_assistant(name: str, context_breakdown: List[TContextBreakdown], welc
     Returns: 
     - details of the assistant
     """
-    return get_client().agent.create(name=name, context_breakdown=context_breakdown,welcome_message=welcome_message)
+    return await get_async_client().agent.create(name=name, context_breakdown=context_breakdown,welcome_message=welcome_message)
 
 
-@mcp.resource("assistants://{page}/{page_size}")
-def get_all_assistants(page=1, page_size=20) -> Dict:
+# Resources hand the upstream JSON body straight through instead of decoding and re-encoding it
+@mcp.resource("assistants://{page}/{page_size}", mime_type="application/json")
+async def get_all_assistants(page=1, page_size=20) -> str:
     """Get a All available assistants
     
     params: 
@@ -58,10 +64,11 @@ def get_all_assistants(page=1, page_size=20) -> Dict:
     Returns: 
     - list of assistants
     """
-    return get_client().agent.list(page=page, page_size=page_size)
+    body = await get_async_client().agent.list(page=page, page_size=page_size, raw=True)
+    return body.decode('utf-8')
 
-@mcp.resource("assistants://{assistant_id}")
-def get_assistant_details(assistant_id = int) -> Dict:
+@mcp.resource("assistants://{assistant_id}", mime_type="application/json")
+async def get_assistant_details(assistant_id: int) -> str:
     """Get assistant's details
     
     params: 
@@ -69,7 +76,8 @@ def get_assistant_details(assistant_id = int) -> Dict:
     Returns: 
     - details of the assistant
     """
-    return get_client().agent.get(agent_id=assistant_id)
+    body = await get_async_client().agent.get(agent_id=assistant_id, raw=True)
+    return body.decode('utf-8')
 
 @mcp.resource("greeting://{name}")
 def get_greeting(name: str) -> str:
@@ -77,9 +85,21 @@ def get_greeting(name: str) -> str:
     return f"Hello, {name}!"
 
 
-def get_client() -> Client:
-    API_KEY = os.getenv(f"OMNIDIMENSION_API_KEY")
-    return Client(api_key=API_KEY)
+# Assistant listings and details are re-read often by MCP clients, so they are
+# served from a short-lived cache; creating or updating an assistant clears it.
+AGENT_CACHE_TTL = {"agents": 20}
+
+
+# The SDK (and its HTTP stack) is imported on first use, not when the server module loads
+@functools.lru_cache(maxsize=1)
+def get_async_client() -> "AsyncClient":
+    from omnidimension import AsyncClient
+    API_KEY = os.getenv("OMNIDIMENSION_API_KEY")
+    # Concurrent tool calls multiplex over one HTTP/2 connection when httpx's h2 support
+    # is installed (OMNIDIM_PREFER_HTTP1=1 opts out)
+    http2 = importlib.util.find_spec("h2") is not None
+    # Fail fast instead of hammering the API while it is down
+    return AsyncClient(api_key=API_KEY, cache_ttl=AGENT_CACHE_TTL, http2=http2, circuit_breaker=True)
 
 
 def create_app():
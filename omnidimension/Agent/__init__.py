@@ -1,4 +1,8 @@
 
+from .._pagination import iter_pages
+from .._validators import validate_context_breakdown
+
+
 class Agent():
     def __init__(self, client):
         """
@@ -9,34 +13,65 @@ class Agent():
         """
         self.client = client
 
-    def list(self, page=1, page_size=30):
+    def list(self, page=1, page_size=30, raw=False):
         """
         Get all agents for the authenticated user.
         
         Args:
             page (int): Page number for pagination (default: 1).
             page_size (int): Number of items per page (default: 30).
+            raw (bool): Return the undecoded JSON body as bytes (default: False).
             
         Returns:
-            dict: Response containing the list of agents.
+            dict: Response containing the list of agents, or bytes if raw is set.
+        """
+        params = {
+            'pageno': page,
+            'pagesize': page_size
+        }
+        return self.client.get("agents", params=params, raw=raw)
+    
+    def iter(self, page_size=50):
+        """
+        Iterate over all agents, fetching the next page while the current one is consumed.
+        
+        Args:
+            page_size (int): Number of items per page (default: 50).
+            
+        Yields:
+            dict: Each agent of the authenticated user.
+        """
+        return iter_pages(lambda page: self.list(page=page, page_size=page_size), 'bots', page_size)
+    
+    def iter_list(self, page=1, page_size=30):
+        """
+        Stream one page of agents, yielding each agent as soon as it is parsed.
+        
+        Args:
+            page (int): Page number for pagination (default: 1).
+            page_size (int): Number of items per page (default: 30).
+            
+        Yields:
+            dict: Each agent on the page.
         """
         params = {
             'pageno': page,
             'pagesize': page_size
         }
-        return self.client.get("agents", params=params)
+        return self.client.iter_items("agents", "bots", params=params)
     
-    def get(self, agent_id):
+    def get(self, agent_id, raw=False):
         """
         Get a specific agent by ID.
         
         Args:
             agent_id (int): The ID of the agent to retrieve.
+            raw (bool): Return the undecoded JSON body as bytes (default: False).
             
         Returns:
-            dict: Response containing the agent details.
+            dict: Response containing the agent details, or bytes if raw is set.
         """
-        return self.client.get(f"agents/{agent_id}")
+        return self.client.get(f"agents/{agent_id}", raw=raw)
     
     def create(self, name, context_breakdown, **kwargs):
         """
@@ -57,13 +92,7 @@ class Agent():
         # Validate required inputs
         if not isinstance(name, str):
             raise ValueError("name must be a string.")
-        if not isinstance(context_breakdown, list) or not all(
-            isinstance(context, dict) and 'title' in context and 'body' in context
-            for context in context_breakdown
-        ):
-            raise ValueError(
-                "context_breakdown must be a list of dictionaries with 'title' and 'body'."
-            )
+        validate_context_breakdown(context_breakdown)
 
         # Prepare the data payload
         data = {
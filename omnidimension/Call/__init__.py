@@ -1,3 +1,5 @@
+from .._validators import validate_phone_number
+
 
 class Call():
     def __init__(self, client):
@@ -27,8 +29,7 @@ class Call():
         # Validate required inputs
         if not isinstance(agent_id, int):
             raise ValueError("agent id must be a integer.")
-        if not isinstance(to_number, str) and to_number[0] != '+':
-            raise ValueError("To Number must be a valid number and starts with + and country code.")            
+        validate_phone_number(to_number)
         
         data = {
             "agent_id": agent_id,
@@ -37,9 +38,45 @@ class Call():
         }
 
         return self.client.post("calls/dispatch", data=data)
+
+    def dispatch_calls(self, agent_id, items, return_exceptions=False):
+        """
+        Dispatch calls to several numbers concurrently using one agent.
+
+        Every call is validated before any is sent.
+
+        Args:
+            agent_id (int): id for the agent.
+            items (list): Numbers to call, either as strings or as dicts with
+                          'to_number' and an optional 'call_context'.
+            return_exceptions (bool): Put failed dispatches' exceptions in the result
+                                      list instead of raising the first one (default: False).
+
+        Returns:
+            list: Responses from the API, in the same order as items.
+
+        Raises:
+            ValueError: If required fields are missing or invalid.
+            APIError: If a dispatch fails and return_exceptions is False.
+        """
+        if not isinstance(items, list):
+            raise ValueError("items must be a list of phone numbers or dicts with 'to_number'.")
+        calls = []
+        for item in items:
+            if isinstance(item, dict):
+                calls.append((item.get('to_number'), item.get('call_context') or {}))
+            else:
+                calls.append((item, {}))
+        for to_number, _ in calls:
+            validate_phone_number(to_number)
+
+        batch = self.client.batch()
+        for to_number, call_context in calls:
+            batch.add(self.dispatch_call, agent_id, to_number, call_context)
+        return batch.execute(concurrent=True, return_exceptions=return_exceptions)
     
 
-    def get_call_logs(self, page=1, page_size=30, agent_id=None):
+    def get_call_logs(self, page=1, page_size=30, agent_id=None, expand=None):
         """
         Get all call logs for the authenticated user.
         
@@ -47,6 +84,7 @@ class Call():
             page (int): Page number for pagination (default: 1).
             page_size (int): Number of items per page (default: 30).
             agent_id (int): Filter by agent ID (optional).
+            expand (str): Ask the server to inline related data, e.g. 'detail' (optional).
         Returns:
             dict: Response containing the list of call logs .
         """
@@ -55,8 +93,31 @@ class Call():
             'pagesize': page_size,
             'agentid': agent_id,
         }
+        if expand is not None:
+            params['expand'] = expand
         return self.client.get("calls/logs", params=params)
     
+    def iter_call_logs(self, page=1, page_size=30, agent_id=None, expand=None):
+        """
+        Stream one page of call logs, yielding each log as soon as it is parsed.
+        
+        Args:
+            page (int): Page number for pagination (default: 1).
+            page_size (int): Number of items per page (default: 30).
+            agent_id (int): Filter by agent ID (optional).
+            expand (str): Ask the server to inline related data, e.g. 'detail' (optional).
+        Yields:
+            dict: Each call log on the page.
+        """
+        params = {
+            'pageno': page,
+            'pagesize': page_size,
+            'agentid': agent_id,
+        }
+        if expand is not None:
+            params['expand'] = expand
+        return self.client.iter_items("calls/logs", "call_log_data", params=params)
+    
     def get_call_log(self, call_log_id):
         """
         Get a specific agent by ID.
@@ -1,5 +1,32 @@
+from .._validators import require_positive_int
+
+# Validation tables for integration parameters, built once at import
+_REQUIRED_PARAM_KEYS = {
+    'headers': ('key', 'value'),
+    'query_params': ('key',),
+    'body_params': ('key',),
+}
+_TYPED_PARAM_LISTS = frozenset(('query_params', 'body_params'))
+_PARAM_TYPES = frozenset(('string', 'number', 'boolean'))
+_HTTP_METHODS = frozenset(('GET', 'POST', 'PUT', 'DELETE', 'PATCH'))
+_BODY_TYPES = frozenset(('none', 'json', 'form'))
+
+# integration_type -> (required fields, create endpoint, label for errors, parameter lists to validate)
+_INTEGRATION_SPECS = {
+    'custom_api': (('name', 'url', 'method'), "integrations/custom-api", "custom API",
+                   ('headers', 'query_params', 'body_params')),
+    'cal': (('name', 'cal_api_key', 'cal_id', 'cal_timezone'), "integrations/cal", "Cal.com", ()),
+}
+
+
 
 class Integrations():
+    __slots__ = ("client",)
+
+    # Agent integration paths; IDs are checked to be ints before formatting
+    _AGENT_INT_URL = "agents/%d/integrations"
+    _AGENT_INT_DEL_URL = "agents/%d/integrations/%d"
+
     def __init__(self, client):
         """
         Initialize the Integrations client with a reference to the main API client.
@@ -84,24 +111,20 @@ class Integrations():
         if not isinstance(params_list, list):
             raise ValueError(f"{param_type} must be a list of dictionaries.")
             
-        required_keys = {
-            'headers': ['key', 'value'],
-            'query_params': ['key'],
-            'body_params': ['key']
-        }
+        required_keys = _REQUIRED_PARAM_KEYS.get(param_type, ())
+        # query_params and body_params also carry typed fields
+        typed = param_type in _TYPED_PARAM_LISTS
         
         for param in params_list:
             if not isinstance(param, dict):
                 raise ValueError(f"Each {param_type} item must be a dictionary.")
                 
-            for key in required_keys.get(param_type, []):
+            for key in required_keys:
                 if key not in param:
                     raise ValueError(f"Each {param_type} item must contain a '{key}' field.")
                     
-        # Additional validation for query_params and body_params
-        if param_type in ['query_params', 'body_params']:
-            for param in params_list:
-                if 'type' in param and param['type'] not in ['string', 'number', 'boolean']:
+            if typed:
+                if 'type' in param and (not isinstance(param['type'], str) or param['type'] not in _PARAM_TYPES):
                     raise ValueError(f"Parameter type must be one of: 'string', 'number', 'boolean'. Got: {param['type']}")
                     
                 if 'required' in param and not isinstance(param['required'], bool):
@@ -184,6 +207,10 @@ class Integrations():
         # Validate required inputs
         if not name or not url or not method:
             raise ValueError("Name, URL, and method are required fields.")
+        if not isinstance(method, str) or method.upper() not in _HTTP_METHODS:
+            raise ValueError(f"Method must be one of {', '.join(sorted(_HTTP_METHODS))}.")
+        if body_type is not None and (not isinstance(body_type, str) or body_type not in _BODY_TYPES):
+            raise ValueError(f"Body type must be one of {', '.join(sorted(_BODY_TYPES))}.")
         
         # Validate parameters format
         self._validate_integration_params(headers, 'headers')
@@ -193,7 +220,7 @@ class Integrations():
         data = {
             "name": name,
             "url": url,
-            "method": method,
+            "method": method.upper(),
             "description": description,
             "integration_type": "custom_api",
             "stop_listening": stop_listening,
@@ -314,6 +341,50 @@ class Integrations():
             client.integrations.create_integration_from_json(integration_data)
             ```
         """
+        endpoint = self._integration_endpoint(integration_data)
+        return self.client.post(endpoint, data=integration_data)
+
+    def batch_create(self, items, return_exceptions=False):
+        """
+        Create several integrations concurrently from complete JSON objects.
+        
+        Every item is validated before any request is sent.
+        
+        Args:
+            items (list): Integration data dicts, each in the format accepted by
+                          create_integration_from_json.
+            return_exceptions (bool): Put failed creations' exceptions in the result list
+                                      instead of raising the first one (default: False).
+                
+        Returns:
+            list: Responses from the API, in the same order as items.
+            
+        Raises:
+            ValueError: If an item is missing required fields or is invalid.
+            APIError: If a creation fails and return_exceptions is False.
+        """
+        if not isinstance(items, list):
+            raise ValueError("items must be a list of integration dictionaries.")
+        endpoints = [self._integration_endpoint(item) for item in items]
+        
+        batch = self.client.batch()
+        for endpoint, item in zip(endpoints, items):
+            batch.add(self.client.post, endpoint, data=item)
+        return batch.execute(concurrent=True, return_exceptions=return_exceptions)
+
+    def _integration_endpoint(self, integration_data):
+        """
+        Validate complete integration data and return the endpoint that creates it.
+        
+        Args:
+            integration_data (dict): Complete integration data.
+            
+        Returns:
+            str: API endpoint for the integration type.
+            
+        Raises:
+            ValueError: If required fields are missing or invalid.
+        """
         if not integration_data or not isinstance(integration_data, dict):
             raise ValueError("Integration data must be a non-empty dictionary.")
             
@@ -321,38 +392,21 @@ class Integrations():
             raise ValueError("Integration data must include 'integration_type' field.")
             
         integration_type = integration_data.get('integration_type')
+        spec = _INTEGRATION_SPECS.get(integration_type) if isinstance(integration_type, str) else None
+        if spec is None:
+            raise ValueError(f"Unsupported integration type: {integration_type}")
+        required_fields, endpoint, label, param_lists = spec
         
-        # Validate based on integration type
-        if integration_type == 'custom_api':
-            # Required fields for custom API
-            required_fields = ['name', 'url', 'method']
-            for field in required_fields:
-                if field not in integration_data:
-                    raise ValueError(f"'{field}' is required for custom API integration.")
-                    
-            # Validate parameters if present
-            if 'headers' in integration_data:
-                self._validate_integration_params(integration_data['headers'], 'headers')
-            if 'query_params' in integration_data:
-                self._validate_integration_params(integration_data['query_params'], 'query_params')
-            if 'body_params' in integration_data:
-                self._validate_integration_params(integration_data['body_params'], 'body_params')
+        for field in required_fields:
+            if field not in integration_data:
+                raise ValueError(f"'{field}' is required for {label} integration.")
                 
-            endpoint = "integrations/custom-api"
+        # Validate parameters if present
+        for param_type in param_lists:
+            if param_type in integration_data:
+                self._validate_integration_params(integration_data[param_type], param_type)
             
-        elif integration_type == 'cal':
-            # Required fields for Cal.com
-            required_fields = ['name', 'cal_api_key', 'cal_id', 'cal_timezone']
-            for field in required_fields:
-                if field not in integration_data:
-                    raise ValueError(f"'{field}' is required for Cal.com integration.")
-                    
-            endpoint = "integrations/cal"
-            
-        else:
-            raise ValueError(f"Unsupported integration type: {integration_type}")
-            
-        return self.client.post(endpoint, data=integration_data)
+        return endpoint
         
     def get_agent_integrations(self, agent_id):
         """
@@ -367,10 +421,9 @@ class Integrations():
         Raises:
             ValueError: If agent_id is not provided or invalid.
         """
-        if not isinstance(agent_id, int) or agent_id <= 0:
-            raise ValueError("Agent ID must be a positive integer.")
+        require_positive_int(agent_id, "Agent ID")
             
-        return self.client.get(f"agents/{agent_id}/integrations")
+        return self.client.get(self._AGENT_INT_URL % agent_id)
     
     def add_integration_to_agent(self, agent_id, integration_id):
         """
@@ -386,17 +439,46 @@ class Integrations():
         Raises:
             ValueError: If required fields are missing or invalid.
         """
-        if not isinstance(agent_id, int) or agent_id <= 0:
-            raise ValueError("Agent ID must be a positive integer.")
-            
-        if not isinstance(integration_id, int) or integration_id <= 0:
-            raise ValueError("Integration ID must be a positive integer.")
+        require_positive_int(agent_id, "Agent ID")
+        require_positive_int(integration_id, "Integration ID")
             
         data = {
             "integration_id": integration_id
         }
         
-        return self.client.post(f"agents/{agent_id}/integrations", data=data)
+        return self.client.post(self._AGENT_INT_URL % agent_id, data=data)
+    
+    def attach_many_to_agent(self, agent_id, integration_ids, return_exceptions=False):
+        """
+        Add several existing integrations to an agent.
+        
+        The API attaches one integration per request, so the requests are sent
+        concurrently. Repeated IDs are only attached once.
+        
+        Args:
+            agent_id (int): ID of the agent.
+            integration_ids (list): IDs of the integrations to add.
+            return_exceptions (bool): Put failed attachments' exceptions in the result list
+                                      instead of raising the first one (default: False).
+            
+        Returns:
+            list: Responses from the API, one per distinct integration ID, in order.
+            
+        Raises:
+            ValueError: If agent_id or any integration ID is not a positive integer.
+            APIError: If an attachment fails and return_exceptions is False.
+        """
+        require_positive_int(agent_id, "Agent ID")
+        if not isinstance(integration_ids, list):
+            raise ValueError("integration_ids must be a list of integers.")
+        for integration_id in integration_ids:
+            require_positive_int(integration_id, "Integration ID")
+        
+        url = self._AGENT_INT_URL % agent_id
+        batch = self.client.batch()
+        for integration_id in dict.fromkeys(integration_ids):
+            batch.add(self.client.post, url, data={"integration_id": integration_id})
+        return batch.execute(concurrent=True, return_exceptions=return_exceptions)
     
     def remove_integration_from_agent(self, agent_id, integration_id):
         """
@@ -412,11 +494,8 @@ class Integrations():
         Raises:
             ValueError: If required fields are missing or invalid.
         """
-        if not isinstance(agent_id, int) or agent_id <= 0:
-            raise ValueError("Agent ID must be a positive integer.")
-            
-        if not isinstance(integration_id, int) or integration_id <= 0:
-            raise ValueError("Integration ID must be a positive integer.")
+        require_positive_int(agent_id, "Agent ID")
+        require_positive_int(integration_id, "Integration ID")
             
-        return self.client.delete(f"agents/{agent_id}/integrations/{integration_id}")
+        return self.client.delete(self._AGENT_INT_DEL_URL % (agent_id, integration_id))
     
\ No newline at end of file
@@ -1,4 +1,12 @@
+import os
+
+from .._upload import Base64FileBody
+from .._validators import require_positive_int, validate_pdf_filename
+
+
 class KnowledgeBase():
+    __slots__ = ("client",)
+
     def __init__(self, client):
         """
         Initialize the KnowledgeBase client with a reference to the main API client.
@@ -21,8 +29,12 @@ class KnowledgeBase():
         """
         Upload a file to the knowledge base.
         
+        Raw bytes and file objects are base64-encoded chunk by chunk while the
+        request is sent, so callers don't need to hold an encoded copy in memory.
+        
         Args:
-            file_data (str): Base64 encoded file content.
+            file_data (str | bytes | file): Base64 encoded file content, the raw file
+                content, or a binary file object opened for reading.
             filename (str): Name of the file (must end with .pdf).
             
         Returns:
@@ -32,8 +44,12 @@ class KnowledgeBase():
             ValueError: If the file is not a PDF.
         """
         # Validate file is a PDF
-        if not filename.lower().endswith('.pdf'):
-            raise ValueError("Only PDF files are supported.")
+        validate_pdf_filename(filename)
+            
+        if not isinstance(file_data, str):
+            body = Base64FileBody(file_data, {"filename": filename})
+            return self.client.post("knowledge_base/create", content=body,
+                                    headers={"Content-Length": str(len(body))})
             
         data = {
             "file": file_data,
@@ -41,6 +57,63 @@ class KnowledgeBase():
         }
         
         return self.client.post("knowledge_base/create", data=data)
+
+    def create_many(self, files, concurrency=8, return_exceptions=False):
+        """
+        Upload several files to the knowledge base concurrently.
+        
+        Every item is checked before anything is sent.
+        
+        Args:
+            files (list): (file_data, filename) tuples, file_data being anything create() accepts.
+            concurrency (int): Maximum number of uploads in flight at once (default: 8).
+            return_exceptions (bool): Put failed uploads' exceptions in the result list
+                                      instead of raising the first one (default: False).
+            
+        Returns:
+            list: Responses containing the created file details, in the same order as files.
+            
+        Raises:
+            ValueError: If files is malformed or a file is not a PDF.
+            APIError: If an upload fails and return_exceptions is False.
+        """
+        # Check every item here so a bad one fails before any upload starts, not inside a worker
+        if not isinstance(files, list) or not all(
+                isinstance(item, (tuple, list)) and len(item) == 2 for item in files):
+            raise ValueError("files must be a list of (file_data, filename) tuples.")
+        for _, filename in files:
+            validate_pdf_filename(filename)
+        
+        batch = self.client.batch()
+        for file_data, filename in files:
+            batch.add(self.create, file_data, filename)
+        return batch.execute(concurrent=True, return_exceptions=return_exceptions,
+                             max_concurrency=concurrency)
+    
+    def create_stream(self, file_path, filename=None):
+        """
+        Upload a file from disk to the knowledge base without loading it into memory.
+
+        The file is base64-encoded chunk by chunk while the request body is sent,
+        so memory use stays flat regardless of the file size.
+
+        Args:
+            file_path (str): Path of the PDF file to upload.
+            filename (str, optional): Name to store the file under (defaults to the file's basename).
+
+        Returns:
+            dict: Response containing the created file details.
+
+        Raises:
+            ValueError: If the file is not a PDF.
+        """
+        if filename is None:
+            filename = os.path.basename(file_path)
+        validate_pdf_filename(filename)
+
+        body = Base64FileBody(file_path, {"filename": filename})
+        return self.client.post("knowledge_base/create", content=body,
+                                headers={"Content-Length": str(len(body))})
     
     def can_upload(self, file_size, file_type="pdf"):
         """
@@ -89,12 +162,11 @@ class KnowledgeBase():
             dict: Response indicating success or failure.
             
         Raises:
-            ValueError: If file_ids is not a list or agent_id is not an integer.
+            ValueError: If file_ids is not a list or agent_id is not a positive integer.
         """
         if not isinstance(file_ids, list):
             raise ValueError("file_ids must be a list of integers.")
-        if not isinstance(agent_id, int):
-            raise ValueError("agent_id must be an integer.")
+        require_positive_int(agent_id, "agent_id")
             
         data = {
             "file_ids": file_ids,
@@ -116,16 +188,58 @@ class KnowledgeBase():
             dict: Response indicating success or failure.
             
         Raises:
-            ValueError: If file_ids is not a list or agent_id is not an integer.
+            ValueError: If file_ids is not a list or agent_id is not a positive integer.
         """
         if not isinstance(file_ids, list):
             raise ValueError("file_ids must be a list of integers.")
-        if not isinstance(agent_id, int):
-            raise ValueError("agent_id must be an integer.")
+        require_positive_int(agent_id, "agent_id")
             
         data = {
             "file_ids": file_ids,
             "agent_id": agent_id
         }
         
-        return self.client.post("knowledge_base/detach", data=data)
\ No newline at end of file
+        return self.client.post("knowledge_base/detach", data=data)
+
+    def sync(self, agent_id, file_ids, current_file_ids, when_to_use=None):
+        """
+        Make an agent hold exactly the given files.
+        
+        Files missing from current_file_ids are attached and files no longer wanted
+        are detached; the two requests run concurrently, so the sync takes a single
+        round trip of wall time. Both requests are always sent, and a failure on one
+        side is returned rather than raised so the caller can see what was applied.
+        
+        Args:
+            agent_id (int): ID of the agent.
+            file_ids (list): IDs of the files the agent should have.
+            current_file_ids (list): IDs of the files currently attached to the agent.
+            when_to_use: when to use the newly attached files
+            
+        Returns:
+            dict: {"attached": ..., "detached": ...}, each holding the response, the
+                  exception the request raised, or None where nothing needed to change.
+            
+        Raises:
+            ValueError: If the file ID lists are not lists or agent_id is not a positive integer.
+        """
+        if not isinstance(file_ids, list) or not isinstance(current_file_ids, list):
+            raise ValueError("file_ids must be a list of integers.")
+        require_positive_int(agent_id, "agent_id")
+        
+        current = set(current_file_ids)
+        wanted = set(file_ids)
+        # Keep the caller's order in the requests
+        to_attach = [file_id for file_id in dict.fromkeys(file_ids) if file_id not in current]
+        to_detach = [file_id for file_id in dict.fromkeys(current_file_ids) if file_id not in wanted]
+        
+        batch = self.client.batch()
+        if to_attach:
+            batch.add(self.attach, to_attach, agent_id, when_to_use=when_to_use)
+        if to_detach:
+            batch.add(self.detach, to_detach, agent_id)
+        results = iter(batch.execute(concurrent=True, return_exceptions=True))
+        return {
+            "attached": next(results) if to_attach else None,
+            "detached": next(results) if to_detach else None,
+        }
@@ -1,4 +1,10 @@
+from .._pagination import iter_pages
+from .._validators import require_positive_int
+
+
 class PhoneNumber():
+    __slots__ = ("client",)
+
     def __init__(self, client):
         """
         Initialize the PhoneNumber client with a reference to the main API client.
@@ -25,6 +31,20 @@ class PhoneNumber():
         }
         return self.client.get("phone_number/list", params=params)
     
+    def iter_all(self, page_size=30, prefetch=2):
+        """
+        Iterate over all phone numbers, loading upcoming pages while the current one is consumed.
+        
+        Args:
+            page_size (int): Number of items per page (default: 30).
+            prefetch (int): Number of pages requested ahead in parallel (default: 2).
+            
+        Yields:
+            dict: Each phone number of the authenticated user.
+        """
+        return iter_pages(lambda page: self.list(page=page, page_size=page_size), 'phone_numbers', page_size,
+                          prefetch=prefetch)
+    
     def attach(self, phone_number_id, agent_id):
         """
         Attach a phone number to an agent.
@@ -37,12 +57,10 @@ class PhoneNumber():
             dict: Response indicating success or failure.
             
         Raises:
-            ValueError: If phone_number_id or agent_id is not an integer.
+            ValueError: If phone_number_id or agent_id is not a positive integer.
         """
-        if not isinstance(phone_number_id, int):
-            raise ValueError("phone_number_id must be an integer.")
-        if not isinstance(agent_id, int):
-            raise ValueError("agent_id must be an integer.")
+        require_positive_int(phone_number_id, "phone_number_id")
+        require_positive_int(agent_id, "agent_id")
             
         data = {
             "phone_number_id": phone_number_id,
@@ -62,10 +80,9 @@ class PhoneNumber():
             dict: Response indicating success or failure.
             
         Raises:
-            ValueError: If phone_number_id is not an integer.
+            ValueError: If phone_number_id is not a positive integer.
         """
-        if not isinstance(phone_number_id, int):
-            raise ValueError("phone_number_id must be an integer.")
+        require_positive_int(phone_number_id, "phone_number_id")
             
         data = {
             "phone_number_id": phone_number_id
@@ -1,4 +1,23 @@
+from .. import _json
+from .._adaptive import AIMDLimiter
+from .._validators import require_int, validate_scenarios
+
+# Per-simulation operations that run_many can fan out
+_BULK_ACTIONS = frozenset(('get', 'start', 'stop', 'delete', 'enhance_prompt'))
+
+# Arguments a create_bulk spec may and must contain, matching create()
+_CREATE_ARGS = frozenset(('name', 'agent_id', 'number_of_call_to_make', 'concurrent_call_count',
+                          'max_call_duration_in_minutes', 'scenarios'))
+_CREATE_REQUIRED_ARGS = frozenset(('name', 'agent_id'))
+
+
 class Simulation():
+    # Simulation paths; IDs are checked to be ints before formatting
+    _SIM_URL = "simulations/%d"
+    _SIM_START_URL = "simulations/%d/start"
+    _SIM_STOP_URL = "simulations/%d/stop"
+    _SIM_ENHANCE_URL = "simulations/%d/enhance-prompt"
+
     def __init__(self, client):
         """
         Initialize the Simulation client with a reference to the main API client.
@@ -7,6 +26,8 @@ class Simulation():
             client: The main API client instance.
         """
         self.client = client
+        # Shared by bulk calls so the concurrency learned from one carries over to the next
+        self._limiter = AIMDLimiter()
 
     def create(self, name, agent_id, number_of_call_to_make=1, concurrent_call_count=3, 
                max_call_duration_in_minutes=3, scenarios=None):
@@ -50,29 +71,79 @@ class Simulation():
             )
             ```
         """
-        # Validate required inputs
-        if not name or not isinstance(name, str):
-            raise ValueError("Name is required and must be a string.")
-        
-        if not isinstance(agent_id, int):
-            raise ValueError("Agent ID must be an integer.")
+        data = self._create_payload(name, agent_id, number_of_call_to_make, concurrent_call_count,
+                                    max_call_duration_in_minutes, scenarios)
+        return self.client.post("simulations", data=data)
 
-        # Validate scenarios if provided
-        if scenarios is not None:
-            self._validate_scenarios(scenarios)
+    def create_bulk(self, specs, concurrency=16, return_exceptions=False, limiter=None):
+        """
+        Create several simulations at once.
 
-        data = {
-            "name": name,
-            "agent_id": agent_id,
-            "number_of_call_to_make": number_of_call_to_make,
-            "concurrent_call_count": concurrent_call_count,
-            "max_call_duration_in_minutes": max_call_duration_in_minutes
-        }
+        Every spec is validated before anything is sent. Within the concurrency cap,
+        the number of creations in flight adapts to the API: it grows while calls
+        succeed and is cut back after 429s, server errors or network errors.
 
-        if scenarios is not None:
-            data["scenarios"] = scenarios
+        Args:
+            specs (list): Dictionaries of create() arguments, e.g.
+                          {"name": "Pizza order", "agent_id": 123, "scenarios": [...]}.
+            concurrency (int, optional): Maximum number of creations in flight at once (default: 16).
+            return_exceptions (bool, optional): Put failed creations' exceptions in the result list
+                                                instead of raising the first one (default: False).
+            limiter (AIMDLimiter | bool, optional): Limiter that paces the requests, e.g.
+                                                    AIMDLimiter(initial=4, maximum=32); False sends
+                                                    up to concurrency at once without adapting
+                                                    (default: the limiter shared by create_bulk
+                                                    and run_many).
 
-        return self.client.post("simulations", data=data)
+        Returns:
+            list: Responses from the API, in the same order as specs.
+
+        Raises:
+            ValueError: If a spec is missing required fields or is invalid.
+            APIError: If a creation fails and return_exceptions is False.
+
+        Example:
+            ```python
+            responses = client.simulation.create_bulk([
+                {"name": "Order Pizza", "agent_id": 123, "scenarios": pizza_scenarios},
+                {"name": "Cancel Order", "agent_id": 123, "scenarios": cancel_scenarios},
+            ])
+            ```
+        """
+        if not isinstance(specs, list):
+            raise ValueError("Specs must be a list of dictionaries.")
+        payloads = []
+        for spec in specs:
+            if not isinstance(spec, dict):
+                raise ValueError("Each spec must be a dictionary of create() arguments.")
+            # Checked here so a bad key is a ValueError rather than a TypeError from the call
+            unknown = spec.keys() - _CREATE_ARGS
+            if unknown:
+                raise ValueError(f"Unknown create() arguments in spec: {', '.join(sorted(map(str, unknown)))}.")
+            if not spec.keys() >= _CREATE_REQUIRED_ARGS:
+                raise ValueError("Each spec must contain 'name' and 'agent_id'.")
+            payloads.append(self._create_payload(**spec))
+
+        # Specs often share one scenarios list; encode each distinct list only once.
+        # The specs keep every list alive, so id() is stable for this call.
+        encoded_scenarios = {}
+        bodies = []
+        for data in payloads:
+            scenarios = data.pop("scenarios", None)
+            body = _json.dumps(data)
+            if scenarios is not None:
+                key = id(scenarios)
+                if key not in encoded_scenarios:
+                    encoded_scenarios[key] = _json.dumps(scenarios)
+                body = body[:-1] + b',"scenarios":' + encoded_scenarios[key] + b'}'
+            bodies.append(body)
+
+        # Resolve the bound methods once rather than per queued call
+        batch = self.client.batch()
+        add, call, post = batch.add, self._limited(limiter), self.client.post
+        for body in bodies:
+            add(call, post, "simulations", content=body)
+        return batch.execute(concurrent=True, return_exceptions=return_exceptions, max_concurrency=concurrency)
 
     def list(self, pageno=1, pagesize=10):
         """
@@ -117,10 +188,9 @@ class Simulation():
             response = client.simulation.get(simulation_id)
             ```
         """
-        if not isinstance(simulation_id, int):
-            raise ValueError("Simulation ID must be an integer.")
+        require_int(simulation_id, "Simulation ID")
 
-        return self.client.get(f"simulations/{simulation_id}")
+        return self.client.get(self._SIM_URL % simulation_id)
 
     def update(self, simulation_id, data):
         """
@@ -154,17 +224,16 @@ class Simulation():
             response = client.simulation.update(simulation_id, update_data)
             ```
         """
-        if not isinstance(simulation_id, int):
-            raise ValueError("Simulation ID must be an integer.")
+        require_int(simulation_id, "Simulation ID")
         
         if not isinstance(data, dict) or not data:
             raise ValueError("Update data must be a non-empty dictionary.")
 
         # Validate scenarios if provided in update data
         if "scenarios" in data and data["scenarios"] is not None:
-            self._validate_scenarios(data["scenarios"])
+            validate_scenarios(data["scenarios"])
 
-        return self.client.put(f"simulations/{simulation_id}", data=data)
+        return self.client.put(self._SIM_URL % simulation_id, data=data)
 
     def delete(self, simulation_id):
         """
@@ -186,10 +255,9 @@ class Simulation():
             response = client.simulation.delete(simulation_id)
             ```
         """
-        if not isinstance(simulation_id, int):
-            raise ValueError("Simulation ID must be an integer.")
+        require_int(simulation_id, "Simulation ID")
 
-        return self.client.delete(f"simulations/{simulation_id}")
+        return self.client.delete(self._SIM_URL % simulation_id)
 
     def start(self, simulation_id):
         """
@@ -217,10 +285,9 @@ class Simulation():
             )
             ```
         """
-        if not isinstance(simulation_id, int):
-            raise ValueError("Simulation ID must be an integer.")
+        require_int(simulation_id, "Simulation ID")
 
-        return self.client.post(f"simulations/{simulation_id}/start", data={})
+        return self.client.post(self._SIM_START_URL % simulation_id)
 
     def stop(self, simulation_id):
         """
@@ -242,10 +309,9 @@ class Simulation():
             response = client.simulation.stop(simulation_id)
             ```
         """
-        if not isinstance(simulation_id, int):
-            raise ValueError("Simulation ID must be an integer.")
+        require_int(simulation_id, "Simulation ID")
 
-        return self.client.post(f"simulations/{simulation_id}/stop")
+        return self.client.post(self._SIM_STOP_URL % simulation_id)
 
     def enhance_prompt(self, simulation_id):
         """
@@ -267,51 +333,92 @@ class Simulation():
             response = client.simulation.enhance_prompt(simulation_id)
             ```
         """
-        if not isinstance(simulation_id, int):
-            raise ValueError("Simulation ID must be an integer.")
+        require_int(simulation_id, "Simulation ID")
 
-        return self.client.post(f"simulations/{simulation_id}/enhance-prompt")
+        return self.client.post(self._SIM_ENHANCE_URL % simulation_id)
+
+    def run_many(self, action, simulation_ids, concurrency=16, return_exceptions=False, limiter=None):
+        """
+        Run the same per-simulation operation for several simulations at once.
+
+        The API takes one simulation per request, so the requests are sent
+        concurrently, paced like create_bulk.
+
+        Args:
+            action (str): One of "get", "start", "stop", "delete" or "enhance_prompt".
+            simulation_ids (list): IDs of the simulations to act on.
+            concurrency (int, optional): Maximum number of requests in flight at once (default: 16).
+            return_exceptions (bool, optional): Put failed calls' exceptions in the result list
+                                                instead of raising the first one (default: False).
+            limiter (AIMDLimiter | bool, optional): Limiter that paces the requests; False
+                                                    disables adaptation (default: the limiter
+                                                    shared with create_bulk).
+
+        Returns:
+            list: Responses from the API, in the same order as simulation_ids.
+
+        Raises:
+            ValueError: If action is unknown or a simulation ID is not an integer.
+            APIError: If a call fails and return_exceptions is False.
+
+        Example:
+            ```python
+            # Stop every running simulation
+            client.simulation.run_many("stop", [456, 457, 458])
+            ```
+        """
+        if not isinstance(action, str) or action not in _BULK_ACTIONS:
+            raise ValueError(f"Action must be one of: {', '.join(sorted(_BULK_ACTIONS))}")
+        if not isinstance(simulation_ids, list):
+            raise ValueError("Simulation IDs must be a list of integers.")
+        for simulation_id in simulation_ids:
+            require_int(simulation_id, "Simulation ID")
+
+        method = getattr(self, action)
+        batch = self.client.batch()
+        add, call = batch.add, self._limited(limiter)
+        for simulation_id in simulation_ids:
+            add(call, method, simulation_id)
+        return batch.execute(concurrent=True, return_exceptions=return_exceptions, max_concurrency=concurrency)
 
     
+    def _limited(self, limiter):
+        """Return a callable that runs fn(*args, **kwargs) through the chosen limiter."""
+        if limiter is False:
+            return lambda fn, *args, **kwargs: fn(*args, **kwargs)
+        return (self._limiter if limiter is None else limiter).call
+
     @staticmethod
-    def _validate_scenarios(scenarios, allow_id=False):
+    def _create_payload(name, agent_id, number_of_call_to_make=1, concurrent_call_count=3,
+                        max_call_duration_in_minutes=3, scenarios=None):
         """
-        Validate scenarios format.
-        
-        Args:
-            scenarios: List of scenarios to validate.
-            allow_id: Whether to allow 'id' field in scenarios (for updates).
-            
+        Validate create() arguments and build the request body.
+
+        Returns:
+            dict: Request body for the create endpoint.
+
         Raises:
-            ValueError: If scenarios don't follow the expected format.
+            ValueError: If required fields are missing or invalid.
         """
+        # Validate required inputs
+        if not name or not isinstance(name, str):
+            raise ValueError("Name is required and must be a string.")
+        
+        require_int(agent_id, "Agent ID")
+
+        # Validate scenarios if provided
+        if scenarios is not None:
+            validate_scenarios(scenarios)
+
+        data = {
+            "name": name,
+            "agent_id": agent_id,
+            "number_of_call_to_make": number_of_call_to_make,
+            "concurrent_call_count": concurrent_call_count,
+            "max_call_duration_in_minutes": max_call_duration_in_minutes
+        }
+
+        if scenarios is not None:
+            data["scenarios"] = scenarios
 
-        if not isinstance(scenarios, list):
-            raise ValueError("Scenarios must be a list of dictionaries.")
-
-        for scenario in scenarios:
-            if not isinstance(scenario, dict):
-                raise ValueError("Each scenario must be a dictionary.")
-
-            # Check required fields
-            required_fields = ['name', 'description', 'expected_result']
-            for field in required_fields:
-                if field not in scenario or not isinstance(scenario[field], str):
-                    raise ValueError(f"Each scenario must contain a '{field}' field as a string.")
-
-            # Validate selected_voices if provided
-            if 'selected_voices' in scenario:
-                voices = scenario['selected_voices']
-                if not isinstance(voices, list):
-                    raise ValueError("selected_voices must be a list of dictionaries.")
-                
-                for voice in voices:
-                    if not isinstance(voice, dict):
-                        raise ValueError("Each voice in selected_voices must be a dictionary.")
-                    
-                    if 'id' not in voice or 'provider' not in voice:
-                        raise ValueError("Each voice must contain 'id' and 'provider' fields.")
-                    
-                    valid_providers = ['eleven_labs', 'deepgram', 'cartesia', 'rime', 'inworld']
-                    if voice['provider'] not in valid_providers:
-                        raise ValueError(f"Voice provider must be one of: {', '.join(valid_providers)}")
+        return data
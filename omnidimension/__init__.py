@@ -1,2 +1,22 @@
-from .client import Client
-from .client import APIError
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ._adaptive import AIMDLimiter
+    from .async_client import AsyncClient
+    from .client import APIError, Client
+
+__all__ = ["Client", "APIError", "AsyncClient", "AIMDLimiter"]
+
+
+def __getattr__(name):
+    # Loaded on first use so entry points like the CLI don't import requests just to show --help
+    if name in ("Client", "APIError"):
+        from . import client
+        return getattr(client, name)
+    if name == "AsyncClient":
+        from .async_client import AsyncClient
+        return AsyncClient
+    if name == "AIMDLimiter":
+        from ._adaptive import AIMDLimiter
+        return AIMDLimiter
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,112 @@
+import logging
+import socket
+import threading
+import time
+
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+logger = logging.getLogger(__name__)
+
+
+def keepalive_socket_options(idle=30, interval=10, count=3):
+    """
+    Build socket options that turn on TCP keepalive probes.
+
+    Options the platform doesn't support are skipped, and urllib3's defaults
+    (TCP_NODELAY) are kept.
+
+    Args:
+        idle (int): Seconds a connection sits idle before the first probe.
+        interval (int): Seconds between probes.
+        count (int): Failed probes before the connection is dropped.
+
+    Returns:
+        list: Socket options in the (level, option, value) form urllib3 expects.
+    """
+    options = list(HTTPConnection.default_socket_options)
+    options.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+    if hasattr(socket, 'TCP_KEEPIDLE'):
+        options.append((socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, idle))
+    elif hasattr(socket, 'TCP_KEEPALIVE'):
+        # macOS names the idle timeout TCP_KEEPALIVE
+        options.append((socket.IPPROTO_TCP, socket.TCP_KEEPALIVE, idle))
+    if hasattr(socket, 'TCP_KEEPINTVL'):
+        options.append((socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, interval))
+    if hasattr(socket, 'TCP_KEEPCNT'):
+        options.append((socket.IPPROTO_TCP, socket.TCP_KEEPCNT, count))
+    return options
+
+
+class PinnedResolver(object):
+    """Caches one resolved address per host so new connections skip getaddrinfo."""
+    def __init__(self, ttl=300):
+        self.ttl = ttl
+        self._addresses = {}
+        self._lock = threading.Lock()
+
+    def resolve(self, host, port):
+        """
+        Return a cached IP address for host, resolving it again once the TTL expires.
+
+        Args:
+            host (str): Hostname to resolve.
+            port (int): Port the connection will use.
+
+        Returns:
+            str: The IP address, or None if resolution failed.
+        """
+        key = (host, port)
+        with self._lock:
+            cached = self._addresses.get(key)
+        if cached is not None and time.monotonic() - cached[1] < self.ttl:
+            return cached[0]
+        try:
+            address = socket.getaddrinfo(host, port, type=socket.SOCK_STREAM)[0][4][0]
+        except (OSError, IndexError) as e:
+            logger.debug("Could not pin DNS for %s:%s: %s", host, port, e)
+            return cached[0] if cached is not None else None
+        with self._lock:
+            self._addresses[key] = (address, time.monotonic())
+        return address
+
+
+def _pinned_pool_class(pool_class, resolver):
+    """Subclass a urllib3 pool so its connections dial the pinned address."""
+    class PinnedConnectionPool(pool_class):
+        def _new_conn(self):
+            conn = super()._new_conn()
+            address = resolver.resolve(self.host, self.port or self.default_port)
+            if address is not None:
+                # Only the socket target changes; Host header, SNI and certificate
+                # checks keep using the original hostname.
+                conn._dns_host = address
+            return conn
+
+    return PinnedConnectionPool
+
+
+class KeepAliveAdapter(HTTPAdapter):
+    """HTTPAdapter whose pooled sockets send TCP keepalive probes while idle."""
+    __attrs__ = HTTPAdapter.__attrs__ + ['socket_options']
+
+    def __init__(self, *args, keepalive_idle=30, resolver=None, **kwargs):
+        # Must be set before HTTPAdapter.__init__ builds the pool manager
+        self.socket_options = keepalive_socket_options(idle=keepalive_idle)
+        self.resolver = resolver
+        super().__init__(*args, **kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs.setdefault('socket_options', self.socket_options)
+        super().init_poolmanager(*args, **kwargs)
+        # The resolver holds a lock, so it isn't pickled with the adapter
+        if getattr(self, 'resolver', None) is not None:
+            self.poolmanager.pool_classes_by_scheme = {
+                'http': _pinned_pool_class(HTTPConnectionPool, self.resolver),
+                'https': _pinned_pool_class(HTTPSConnectionPool, self.resolver),
+            }
+
+    def proxy_manager_for(self, proxy, **proxy_kwargs):
+        proxy_kwargs.setdefault('socket_options', self.socket_options)
+        return super().proxy_manager_for(proxy, **proxy_kwargs)
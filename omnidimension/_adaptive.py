@@ -0,0 +1,77 @@
+import threading
+
+
+class AIMDLimiter(object):
+    """
+    Concurrency limit that adapts to how the API is coping.
+
+    The limit grows by about one slot per round of successful calls and is cut
+    by a factor when the API signals overload: a 429, a 5xx or a network error.
+    Latency alone never lowers it, so a backend that is merely slow keeps its
+    concurrency.
+    """
+    def __init__(self, initial=8, minimum=1, maximum=64, decrease=0.5):
+        """
+        Args:
+            initial (int): Calls allowed in flight at the start.
+            minimum (int): Lowest the limit can drop to.
+            maximum (int): Highest the limit can grow to.
+            decrease (float): Factor the limit is multiplied by after an overload signal.
+        """
+        if not 1 <= minimum <= initial <= maximum:
+            raise ValueError("AIMDLimiter needs 1 <= minimum <= initial <= maximum.")
+        if not 0 < decrease < 1:
+            raise ValueError("decrease must be between 0 and 1.")
+        self.minimum = minimum
+        self.maximum = maximum
+        self.decrease = decrease
+        self._limit = float(initial)
+        self._in_flight = 0
+        self._cond = threading.Condition()
+
+    @property
+    def limit(self):
+        """Current number of calls allowed in flight."""
+        return max(self.minimum, int(self._limit))
+
+    def call(self, fn, *args, **kwargs):
+        """
+        Run fn once a slot is free and feed its outcome back into the limit.
+
+        Args:
+            fn (callable): The call to run.
+            *args: Positional arguments for fn.
+            **kwargs: Keyword arguments for fn.
+
+        Returns:
+            Whatever fn returns; its exceptions propagate unchanged.
+        """
+        with self._cond:
+            while self._in_flight >= self.limit:
+                self._cond.wait()
+            self._in_flight += 1
+        outcome = None
+        try:
+            result = fn(*args, **kwargs)
+            outcome = True
+            return result
+        except Exception as e:
+            # Only throttling, server and network errors say the API is overloaded;
+            # other failures (bad input, 404) leave the limit alone
+            status = getattr(e, 'status_code', None)
+            if status is not None and (status == 0 or status == 429 or status >= 500):
+                outcome = False
+            raise
+        finally:
+            self._record(outcome)
+
+    def _record(self, outcome):
+        """Release a slot and adjust the limit: True grows it, False shrinks it, None keeps it."""
+        with self._cond:
+            self._in_flight -= 1
+            if outcome:
+                # Additive increase: +1 once every call in a full window has succeeded
+                self._limit = min(self.maximum, self._limit + 1.0 / self._limit)
+            elif outcome is False:
+                self._limit = max(self.minimum, self._limit * self.decrease)
+            self._cond.notify_all()
@@ -0,0 +1,47 @@
+import threading
+import time
+
+
+class CircuitBreaker(object):
+    """Fails fast once the API has failed several times in a row, until a cooldown passes."""
+    def __init__(self, threshold=5, cooldown=30.0):
+        """
+        Args:
+            threshold (int): Consecutive failures that open the breaker.
+            cooldown (float): Seconds to fail fast before trying the API again.
+        """
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self._failures = 0
+        self._opened_at = None
+        self._lock = threading.Lock()
+
+    def allow(self):
+        """Return True if a request may be sent, False while the breaker is open."""
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            if time.monotonic() - self._opened_at < self.cooldown:
+                return False
+            # Half-open: let requests through again, but one more failure re-opens it
+            self._opened_at = None
+            self._failures = self.threshold - 1
+            return True
+
+    def record(self, ok):
+        """Record the outcome of a request."""
+        with self._lock:
+            if ok:
+                self._failures = 0
+                self._opened_at = None
+            else:
+                self._failures += 1
+                if self._failures >= self.threshold:
+                    self._opened_at = time.monotonic()
+
+    def retry_in(self):
+        """Seconds until the open breaker lets requests through again."""
+        with self._lock:
+            if self._opened_at is None:
+                return 0.0
+            return max(0.0, self.cooldown - (time.monotonic() - self._opened_at))
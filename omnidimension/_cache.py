@@ -0,0 +1,68 @@
+import threading
+import time
+from collections import OrderedDict
+
+
+class CacheEntry(object):
+    """A cached response together with its ETag and expiry time."""
+    __slots__ = ("value", "etag", "expires_at")
+
+    def __init__(self, value, ttl, etag=None):
+        self.value = value
+        self.etag = etag
+        self.expires_at = time.monotonic() + ttl
+
+    def is_fresh(self):
+        return time.monotonic() < self.expires_at
+
+    def refresh(self, ttl):
+        self.expires_at = time.monotonic() + ttl
+
+
+class TTLCache(object):
+    """Thread-safe LRU cache whose entries expire after a per-entry TTL."""
+    def __init__(self, maxsize=1024):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """Return the entry for key (fresh or stale), or None if missing."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key, value, ttl, etag=None):
+        """Store value under key, evicting the least recently used entry if full."""
+        with self._lock:
+            self._entries[key] = CacheEntry(value, ttl, etag)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, prefix):
+        """
+        Drop every entry whose path is prefix or lies below it.
+
+        Args:
+            prefix (str): Endpoint path without leading/trailing slashes, e.g. "agents".
+
+        Returns:
+            int: Number of entries dropped.
+        """
+        below = prefix + '/'
+        with self._lock:
+            stale = [key for key in self._entries if key[0] == prefix or key[0].startswith(below)]
+            for key in stale:
+                del self._entries[key]
+        return len(stale)
+
+    def clear(self):
+        """Drop every entry."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
@@ -0,0 +1,63 @@
+import email.utils
+import logging
+import time
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# Same policy as the urllib3 Retry on the requests session: only idempotent
+# methods are retried, so a POST such as a call dispatch is never sent twice
+RETRY_METHODS = frozenset(('GET', 'HEAD', 'PUT', 'DELETE', 'OPTIONS', 'TRACE'))
+RETRY_STATUSES = frozenset((429, 500, 502, 503, 504))
+
+
+class RetryTransport(httpx.BaseTransport):
+    """Transport that retries throttled and failed idempotent requests, honouring Retry-After."""
+    def __init__(self, transport, total=3, backoff_factor=0.2):
+        """
+        Args:
+            transport (httpx.BaseTransport): Transport that actually sends the requests.
+            total (int): Retries allowed per request.
+            backoff_factor (float): Sleep backoff_factor * 2 ** n seconds before retry n + 1
+                                    when the response has no Retry-After header.
+        """
+        self._transport = transport
+        self.total = total
+        self.backoff_factor = backoff_factor
+
+    def handle_request(self, request):
+        retries = 0
+        while True:
+            response = self._transport.handle_request(request)
+            if (retries >= self.total or request.method not in RETRY_METHODS
+                    or response.status_code not in RETRY_STATUSES):
+                return response
+            delay = _retry_after(response)
+            if delay is None:
+                delay = self.backoff_factor * 2 ** retries
+            response.close()
+            retries += 1
+            logger.debug("Retrying %s %s after %s (retry %d)", request.method, request.url,
+                         response.status_code, retries)
+            time.sleep(delay)
+
+    def close(self):
+        self._transport.close()
+
+
+def _retry_after(response):
+    """Return the seconds a Retry-After header asks for, or None if it is missing or malformed."""
+    value = response.headers.get('Retry-After')
+    if value is None:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return int(value)
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when is None:
+        return None
+    return max(0.0, when.timestamp() - time.time())
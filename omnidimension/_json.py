@@ -0,0 +1,56 @@
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+
+if orjson is not None:
+    def dumps(obj):
+        """Serialize obj to compact JSON bytes."""
+        # Like the stdlib, accept int/float/bool keys and write them as strings
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+
+    loads = orjson.loads
+else:
+    def dumps(obj):
+        """Serialize obj to compact JSON bytes."""
+        return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+    loads = json.loads
+
+
+def iter_items(chunks, items_key):
+    """
+    Yield the elements of a top-level list from a JSON document read in chunks.
+
+    Args:
+        chunks (iterable): The document as an iterable of bytes.
+        items_key (str): Top-level key of the list to iterate.
+
+    Yields:
+        Each element of the list, in order.
+    """
+    if ijson is None:
+        document = loads(b''.join(chunks)) or {}
+        for item in document.get(items_key) or []:
+            yield item
+        return
+
+    # Parse incrementally, handing out items as soon as each one is complete
+    items = ijson.sendable_list()
+    parser = ijson.items_coro(items, items_key + '.item', use_float=True)
+    for chunk in chunks:
+        parser.send(chunk)
+        for item in items:
+            yield item
+        del items[:]
+    parser.close()
+    for item in items:
+        yield item
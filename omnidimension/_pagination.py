@@ -0,0 +1,41 @@
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+
+def iter_pages(fetch, items_key, page_size, prefetch=1):
+    """
+    Yield items from a paginated endpoint while upcoming pages load in the background.
+
+    Args:
+        fetch (callable): Called as fetch(page) and returns a client response dict.
+        items_key (str): Key of the item list in the response JSON.
+        page_size (int): Number of items per page; a shorter page ends iteration.
+        prefetch (int): Number of pages to request ahead of the consumer (default: 1).
+
+    Yields:
+        dict: Each item of each page, in order.
+    """
+    if not isinstance(prefetch, int) or prefetch < 1:
+        raise ValueError("prefetch must be a positive integer.")
+
+    executor = ThreadPoolExecutor(max_workers=prefetch)
+    pending = deque(executor.submit(fetch, page) for page in range(1, prefetch + 1))
+    next_page = prefetch + 1
+    try:
+        while pending:
+            response = pending.popleft().result()
+            items = (response.get('json') or {}).get(items_key) or []
+            if len(items) < page_size:
+                # Last page: anything already requested past it is not needed
+                for future in pending:
+                    future.cancel()
+                pending.clear()
+            else:
+                pending.append(executor.submit(fetch, next_page))
+                next_page += 1
+            for item in items:
+                yield item
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=False)
@@ -0,0 +1,64 @@
+import copy
+import threading
+
+
+class _Flight(object):
+    __slots__ = ("done", "value", "error", "waiters")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value = None
+        self.error = None
+        self.waiters = 0
+
+
+class SingleFlight(object):
+    """Lets concurrent calls with the same key share a single execution."""
+    def __init__(self):
+        self._flights = {}
+        self._lock = threading.Lock()
+
+    def do(self, key, fn):
+        """
+        Run fn, or wait for the identical call already running and share its result.
+
+        Callers that join a running call get their own deep copy of the result,
+        so none of them can see another's changes.
+
+        Args:
+            key: Hashable identity of the call.
+            fn (callable): Called with no arguments to produce the result.
+
+        Returns:
+            The result of fn.
+        """
+        with self._lock:
+            flight = self._flights.get(key)
+            if flight is None:
+                flight = self._flights[key] = _Flight()
+                leader = True
+            else:
+                flight.waiters += 1
+                leader = False
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return copy.deepcopy(flight.value)
+
+        value = None
+        try:
+            value = fn()
+            return value
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+                shared = flight.waiters > 0
+            if shared and flight.error is None:
+                # Snapshot before the leader's caller gets the value and can change it
+                flight.value = copy.deepcopy(value)
+            flight.done.set()
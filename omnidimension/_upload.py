@@ -0,0 +1,82 @@
+import base64
+import os
+
+from . import _json
+
+# Multiple of 3 so every chunk encodes to base64 without padding
+CHUNK_SIZE = 57 * 1024
+
+
+class Base64FileBody(object):
+    """
+    JSON request body that base64-encodes a file while it is being sent.
+
+    Only one chunk of the file is held in memory at a time, and the encoded
+    length is known up front so the body goes out with a Content-Length
+    instead of chunked transfer encoding.
+    """
+    def __init__(self, source, fields, file_key="file"):
+        """
+        Args:
+            source: Path of the file to send, its raw content as bytes, or a binary
+                    file object positioned at the start of the content.
+            fields (dict): Other JSON fields to send alongside the file.
+            file_key (str): JSON key that holds the base64 file content.
+        """
+        self.source = source
+        # Everything up to the opening quote of the file value, e.g. {"filename": "a.pdf", "file": "
+        head = _json.dumps(dict(fields, **{file_key: ""}))
+        self._head = head[:-2]
+        self._tail = b'"}'
+        self._encoded_size = 4 * ((_source_size(source) + 2) // 3)
+
+    def __len__(self):
+        return len(self._head) + self._encoded_size + len(self._tail)
+
+    def __iter__(self):
+        yield self._head
+        if isinstance(self.source, (bytes, bytearray, memoryview)):
+            # Slicing a memoryview doesn't copy the underlying bytes
+            view = memoryview(self.source)
+            for start in range(0, len(view), CHUNK_SIZE):
+                yield base64.b64encode(view[start:start + CHUNK_SIZE])
+        elif isinstance(self.source, (str, os.PathLike)):
+            with open(self.source, "rb") as f:
+                for chunk in _read_chunks(f):
+                    yield base64.b64encode(chunk)
+        else:
+            for chunk in _read_chunks(self.source):
+                yield base64.b64encode(chunk)
+        yield self._tail
+
+
+def _read_chunks(f):
+    """
+    Yield full CHUNK_SIZE chunks of f, followed by whatever is left at EOF.
+
+    read() may return fewer bytes than asked for (pipes, sockets, raw files), and
+    a short chunk in the middle would put base64 padding inside the body.
+    """
+    while True:
+        chunk = f.read(CHUNK_SIZE)
+        if not chunk:
+            return
+        while len(chunk) < CHUNK_SIZE:
+            more = f.read(CHUNK_SIZE - len(chunk))
+            if not more:
+                break
+            chunk += more
+        yield chunk
+
+
+def _source_size(source):
+    """Return the number of bytes that will be read from source."""
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return memoryview(source).nbytes
+    if isinstance(source, (str, os.PathLike)):
+        return os.path.getsize(source)
+    # File object: whatever remains after the current position
+    position = source.tell()
+    end = source.seek(0, os.SEEK_END)
+    source.seek(position)
+    return end - position
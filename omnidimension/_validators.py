@@ -0,0 +1,136 @@
+import re
+
+# Keys every context_breakdown section must have
+CONTEXT_SECTION_KEYS = frozenset(('title', 'body'))
+
+# Fields every simulation scenario must have as strings
+SCENARIO_FIELDS = ('name', 'description', 'expected_result')
+
+# Voice providers accepted in a scenario's selected_voices, in the order the error lists them
+VOICE_PROVIDERS = ('eleven_labs', 'deepgram', 'cartesia', 'rime', 'inworld')
+_VOICE_PROVIDER_SET = frozenset(VOICE_PROVIDERS)
+
+# E.164: a + followed by the country code and subscriber number, ASCII digits only
+PHONE_NUMBER_RE = re.compile(r'\+[0-9]{6,15}')
+
+
+def validate_context_breakdown(context_breakdown):
+    """
+    Check that context_breakdown is a list of sections with 'title' and 'body'.
+
+    Args:
+        context_breakdown (list): List of context breakdown sections.
+
+    Raises:
+        ValueError: If it isn't a list or a section is missing a key.
+    """
+    if isinstance(context_breakdown, list):
+        for context in context_breakdown:
+            # dict key views support set comparison, so this is a single C-level check
+            if not isinstance(context, dict) or not context.keys() >= CONTEXT_SECTION_KEYS:
+                break
+        else:
+            return
+    raise ValueError(
+        "context_breakdown must be a list of dictionaries with 'title' and 'body'."
+    )
+
+
+def validate_scenarios(scenarios):
+    """
+    Check that scenarios is a list of simulation scenarios.
+
+    Args:
+        scenarios (list): Scenarios with 'name', 'description' and 'expected_result'
+                          strings and optional 'selected_voices'.
+
+    Raises:
+        ValueError: If the list or any scenario or voice is malformed.
+    """
+    # Reject the wrong shape before looking inside any scenario
+    if not isinstance(scenarios, list):
+        raise ValueError("Scenarios must be a list of dictionaries.")
+    if not all(isinstance(scenario, dict) for scenario in scenarios):
+        raise ValueError("Each scenario must be a dictionary.")
+
+    for scenario in scenarios:
+        # Check required fields
+        for field in SCENARIO_FIELDS:
+            if not isinstance(scenario.get(field), str):
+                raise ValueError(f"Each scenario must contain a '{field}' field as a string.")
+
+        # Validate selected_voices if provided
+        if 'selected_voices' not in scenario:
+            continue
+        voices = scenario['selected_voices']
+        if not isinstance(voices, list):
+            raise ValueError("selected_voices must be a list of dictionaries.")
+
+        for voice in voices:
+            if not isinstance(voice, dict):
+                raise ValueError("Each voice in selected_voices must be a dictionary.")
+            if 'id' not in voice or 'provider' not in voice:
+                raise ValueError("Each voice must contain 'id' and 'provider' fields.")
+            provider = voice['provider']
+            if not isinstance(provider, str) or provider not in _VOICE_PROVIDER_SET:
+                raise ValueError(f"Voice provider must be one of: {', '.join(VOICE_PROVIDERS)}")
+
+
+def validate_phone_number(to_number):
+    """
+    Check that to_number is an E.164 phone number such as "+15551234567".
+
+    Args:
+        to_number (str): Phone number to check.
+
+    Raises:
+        ValueError: If it isn't a string of + followed by 6 to 15 digits.
+    """
+    if not isinstance(to_number, str) or PHONE_NUMBER_RE.fullmatch(to_number) is None:
+        raise ValueError("To Number must be a valid number and starts with + and country code.")
+
+
+def validate_pdf_filename(filename):
+    """
+    Check that filename names a PDF file.
+
+    Args:
+        filename (str): Name the file will be stored under.
+
+    Raises:
+        ValueError: If it isn't a string ending in .pdf.
+    """
+    if not isinstance(filename, str):
+        raise ValueError("filename must be a string.")
+    if not filename.lower().endswith('.pdf'):
+        raise ValueError("Only PDF files are supported.")
+
+
+def require_int(value, name):
+    """
+    Check that value is an integer ID.
+
+    Args:
+        value: Value to check; an exact type check, so bool is rejected.
+        name (str): Name used in the error message, e.g. "Simulation ID".
+
+    Raises:
+        ValueError: If value is not an int.
+    """
+    if type(value) is not int:
+        raise ValueError(f"{name} must be an integer.")
+
+
+def require_positive_int(value, name):
+    """
+    Check that value is a positive integer ID.
+
+    Args:
+        value: Value to check; bool is rejected even though it is an int subclass.
+        name (str): Name used in the error message, e.g. "Agent ID".
+
+    Raises:
+        ValueError: If value is not a positive int.
+    """
+    if type(value) is not int or value <= 0:
+        raise ValueError(f"{name} must be a positive integer.")
@@ -0,0 +1,137 @@
+import asyncio
+import functools
+
+from .client import Client
+
+
+# Methods that return a sync iterator; they become async generators rather than coroutines
+_ITERATOR_METHODS = frozenset(('iter', 'iter_list', 'iter_all', 'iter_call_logs'))
+
+# Returned by next() once an iterator is exhausted (StopIteration can't cross a future)
+_DONE = object()
+
+
+class _AsyncResource(object):
+    """Expose the methods of a sync domain client as coroutines."""
+    def __init__(self, resource, run):
+        self._resource = resource
+        self._run = run
+
+    def __getattr__(self, name):
+        attr = getattr(self._resource, name)
+        if not callable(attr):
+            return attr
+
+        if name in _ITERATOR_METHODS:
+            @functools.wraps(attr)
+            async def iterate(*args, **kwargs):
+                # Every step of the sync iterator does blocking I/O, so each runs off the loop
+                iterator = await self._run(attr, *args, **kwargs)
+                try:
+                    while True:
+                        item = await self._run(next, iterator, _DONE)
+                        if item is _DONE:
+                            return
+                        yield item
+                finally:
+                    # Release a streamed response if the caller stops early
+                    close = getattr(iterator, 'close', None)
+                    if close is not None:
+                        await self._run(close)
+
+            return iterate
+
+        @functools.wraps(attr)
+        async def method(*args, **kwargs):
+            return await self._run(attr, *args, **kwargs)
+
+        return method
+
+
+class AsyncClient(object):
+    def __init__(self, api_key, base_url='https://backend.omnidim.io/api/v1', max_workers=16, **client_options):
+        """
+        Initialize the async client.
+
+        Every call is executed on the thread pool of a single pooled sync
+        Client, so independent requests awaited together (for example
+        with asyncio.gather) overlap their network round trips while sharing
+        keep-alive connections.
+
+        Args:
+            api_key (str): The API key for authentication.
+            base_url (str): The base URL of the API.
+            max_workers (int): Maximum number of requests in flight at once.
+            **client_options: Other Client options, e.g. cache_ttl or http2.
+        """
+        self._client = Client(api_key, base_url=base_url, max_workers=max_workers, **client_options)
+
+    async def _run(self, fn, /, *args, **kwargs):
+        return await asyncio.wrap_future(self._client.submit(fn, *args, **kwargs))
+
+    async def request(self, method, endpoint, params=None, headers=None, data=None, json_data=None, content=None,
+                      raw=False):
+        """Async counterpart of Client.request."""
+        return await self._run(self._client.request, method, endpoint, params=params,
+                               headers=headers, data=data, json_data=json_data, content=content, raw=raw)
+
+    async def get(self, endpoint, params=None, headers=None, raw=False):
+        """Make a GET request to the API."""
+        return await self._run(self._client.get, endpoint, params=params, headers=headers, raw=raw)
+
+    async def post(self, endpoint, data=None, params=None, headers=None, content=None):
+        """Make a POST request to the API."""
+        return await self._run(self._client.post, endpoint, data=data, params=params, headers=headers,
+                               content=content)
+
+    async def put(self, endpoint, data=None, params=None, headers=None, content=None):
+        """Make a PUT request to the API."""
+        return await self._run(self._client.put, endpoint, data=data, params=params, headers=headers,
+                               content=content)
+
+    async def delete(self, endpoint, params=None, headers=None):
+        """Make a DELETE request to the API."""
+        return await self._run(self._client.delete, endpoint, params=params, headers=headers)
+
+    async def close(self):
+        """Wait for in-flight requests and release pooled connections."""
+        # Client.close() blocks until submitted calls finish, so it runs on the loop's
+        # default executor (its own pool would be waiting on itself)
+        await asyncio.get_running_loop().run_in_executor(None, self._client.close)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    # Domain-specific clients, each built on first access
+    @functools.cached_property
+    def agent(self):
+        """Get the async Agent client."""
+        return _AsyncResource(self._client.agent, self._run)
+
+    @functools.cached_property
+    def call(self):
+        """Get the async Call client."""
+        return _AsyncResource(self._client.call, self._run)
+
+    @functools.cached_property
+    def integrations(self):
+        """Get the async Integrations client."""
+        return _AsyncResource(self._client.integrations, self._run)
+
+    @functools.cached_property
+    def knowledge_base(self):
+        """Get the async KnowledgeBase client."""
+        return _AsyncResource(self._client.knowledge_base, self._run)
+
+    @functools.cached_property
+    def phone_number(self):
+        """Get the async PhoneNumber client."""
+        return _AsyncResource(self._client.phone_number, self._run)
+
+    @functools.cached_property
+    def simulation(self):
+        """Get the async Simulation client."""
+        return _AsyncResource(self._client.simulation, self._run)
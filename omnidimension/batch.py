@@ -0,0 +1,87 @@
+from concurrent.futures import ThreadPoolExecutor
+
+
+class Batch(object):
+    def __init__(self, client):
+        """
+        Initialize a batch of SDK calls bound to a client.
+
+        Queued calls are sent over the client's pooled session when the batch
+        is executed, so they share warm keep-alive connections.
+
+        Args:
+            client: The main API client instance.
+        """
+        self.client = client
+        self._calls = []
+
+    def add(self, fn, /, *args, **kwargs):
+        """
+        Queue an SDK call.
+
+        Args:
+            fn (callable): Bound SDK method, e.g. client.integrations.get_agent_integrations.
+                Positional-only, so methods that take their own method= keyword can be queued.
+            *args: Positional arguments for fn.
+            **kwargs: Keyword arguments for fn.
+
+        Returns:
+            Batch: The batch itself, so calls can be chained.
+        """
+        if not callable(fn):
+            raise ValueError("fn must be a callable SDK method.")
+        self._calls.append((fn, args, kwargs))
+        return self
+
+    def __len__(self):
+        return len(self._calls)
+
+    def execute(self, concurrent=False, return_exceptions=False, max_concurrency=None):
+        """
+        Run all queued calls and clear the batch.
+
+        Args:
+            concurrent (bool): Run the calls in parallel on a thread pool of the batch's own.
+                               Only use this when the calls don't depend on each
+                               other (default: False).
+            return_exceptions (bool): Run every call even if some fail, putting each
+                                      failure's exception in the result list instead
+                                      of raising the first one (default: False).
+            max_concurrency (int, optional): Maximum number of calls running at once when
+                                             concurrent is set (default: the client's
+                                             max_workers).
+
+        Returns:
+            list: Results of the calls, in the order they were added.
+        """
+        calls, self._calls = self._calls, []
+        if not concurrent or len(calls) < 2:
+            if not return_exceptions:
+                return [method(*args, **kwargs) for method, args, kwargs in calls]
+            results = []
+            for method, args, kwargs in calls:
+                try:
+                    results.append(method(*args, **kwargs))
+                except Exception as e:
+                    results.append(e)
+            return results
+
+        if max_concurrency is None:
+            max_concurrency = self.client._max_workers
+        elif not isinstance(max_concurrency, int) or max_concurrency < 1:
+            raise ValueError("max_concurrency must be a positive integer.")
+        # A pool of its own rather than client.submit(): the batch may itself be running
+        # on one of the client's workers (AsyncClient, nested bulk helpers), and waiting
+        # there for calls queued behind it would deadlock once that pool is full.
+        with ThreadPoolExecutor(max_workers=min(max_concurrency, len(calls))) as executor:
+            futures = [executor.submit(method, *args, **kwargs) for method, args, kwargs in calls]
+            # Wait for every call so none is left running unseen when one fails
+            results = []
+            for future in futures:
+                error = future.exception()
+                results.append(error if error is not None else future.result())
+        if not return_exceptions:
+            for result in results:
+                if isinstance(result, Exception):
+                    raise result
+        return results
@@ -6,10 +6,10 @@ omnidim cli — terminal interface to manage your omnidimension agents
 - works with the official omnidimension sdk
 
 features:
-- list agents with pagination
+- list agents with pagination (optionally with full details)
 - get agent details by id
-- create agents with name, welcome message, and context
-- update agents with raw json
+- create agents with name, welcome message, and context (or from a json file)
+- update agents with raw json or a json file
 - delete agents instantly
 
 usage:
@@ -17,9 +17,12 @@ usage:
 
     # basic commands
     omnidim list-agents
+    omnidim list-agents --with-details
     omnidim get-agent AGENT_ID
     omnidim create-agent -n "Echo" -w "hello" -c "this is a test agent"
+    omnidim create-agent -f agent.json
     omnidim update-agent AGENT_ID -d '{"name": "new name"}'
+    omnidim update-agent AGENT_ID -f update.json
     omnidim delete-agent AGENT_ID
 
 dev notes:
@@ -30,15 +33,27 @@ dev notes:
 """
 
 import typer
-import json
 import os
+from pathlib import Path
+from typing import Optional
+from functools import lru_cache
 from rich.console import Console
-from rich.table import Table
-from omnidimension.client import Client
+from omnidimension import _json
 
 app = typer.Typer(help="omnidimension cli — manage agents and more")
 console = Console()
 
+def print_json(data):
+    """
+    render already-parsed data as highlighted json on the shared console
+    """
+    from rich.json import JSON
+
+    console.print(JSON.from_data(data, indent=2))
+
+
+# ~ one pooled client per process, so repeated commands reuse its keep-alive connections
+@lru_cache(maxsize=1)
 def get_client():
     api_key = os.getenv("OMNIDIMENSION_API_KEY")
 
@@ -58,10 +73,17 @@ def get_client():
             f"[green]✔ api key set for this session[/green]\n"
             f"to persist it, run:\n[cyan]export OMNIDIMENSION_API_KEY={api_key}[/cyan]"
         )
+    # ~ imported here so --help and argument errors never load the http stack
+    from omnidimension.client import Client
+
     return Client(api_key)
 
 @app.command("list-agents")
-def list_agents(page: int = 1, page_size: int = 10):
+def list_agents(
+    page: int = 1,
+    page_size: int = 10,
+    with_details: bool = typer.Option(False, "--with-details", help="also fetch and print each agent's full config"),
+):
     """
     list all agents with pagination
     """
@@ -73,6 +95,8 @@ def list_agents(page: int = 1, page_size: int = 10):
         console.print("[yellow]no agents found[/yellow]")
         return
 
+    from rich.table import Table
+
     table = Table(show_header=True, header_style="bold magenta")
     table.add_column("ID")
     table.add_column("Name")
@@ -87,6 +111,14 @@ def list_agents(page: int = 1, page_size: int = 10):
 
     console.print(table)
 
+    if with_details:
+        # ~ detail fetches are independent, so run up to 8 at once over the pooled session
+        batch = client.batch()
+        for agent in agent_list:
+            batch.add(client.agent.get, agent.get("id"))
+        for detail in batch.execute(concurrent=True, max_concurrency=8):
+            print_json(detail.get("json", {}))
+
 
 
 @app.command("get-agent")
@@ -96,43 +128,75 @@ def get_agent(agent_id: str):
     """
     client = get_client()
     agent = client.agent.get(agent_id)
-    console.print_json(data=agent)
+    print_json(agent)
+
+
+def load_json_file(path: Path):
+    """
+    read a json config file as bytes and decode it in one go
+    """
+    try:
+        return _json.loads(path.read_bytes())
+    except (OSError, ValueError) as e:
+        console.print(f"[red]could not read {path}: {e}[/red]")
+        raise typer.Exit()
 
 
 @app.command("create-agent")
 def create_agent(
-    name: str = typer.Option(..., "--name", "-n", help="name of the agent"),
-    welcome: str = typer.Option(..., "--welcome", "-w", help="welcome message"),
-    context: str = typer.Option(..., "--context", "-c", help="context JSON or text"),
+    name: Optional[str] = typer.Option(None, "--name", "-n", help="name of the agent"),
+    welcome: Optional[str] = typer.Option(None, "--welcome", "-w", help="welcome message"),
+    context: Optional[str] = typer.Option(None, "--context", "-c", help="context JSON or text"),
+    from_file: Optional[Path] = typer.Option(None, "--file", "-f", help="json file with the full agent config"),
 ):
     """
-    create a new agent with minimal config
+    create a new agent with minimal config, or from a json config file
     """
-    try:
-        context_breakdown = json.loads(context)
-        if not isinstance(context_breakdown, list):
-            raise ValueError
-    except Exception:
-        context_breakdown = [{"title": "Purpose", "body": context}]
+    # ~ options given on the command line override the file
+    config = load_json_file(from_file) if from_file else {}
+    if not isinstance(config, dict):
+        console.print("[red]agent config file must contain a json object[/red]")
+        raise typer.Exit()
+    if name:
+        config["name"] = name
+    if welcome:
+        config["welcome_message"] = welcome
+    if context:
+        try:
+            context_breakdown = _json.loads(context)
+            if not isinstance(context_breakdown, list):
+                raise ValueError
+        except Exception:
+            context_breakdown = [{"title": "Purpose", "body": context}]
+        config["context_breakdown"] = context_breakdown
+    if "name" not in config or "context_breakdown" not in config:
+        console.print("[red]an agent needs a name and a context (--name/--context or --file)[/red]")
+        raise typer.Exit()
 
     client = get_client()
-    response = client.agent.create(
-        name=name,
-        welcome_message=welcome,
-        context_breakdown=context_breakdown
-    )
+    response = client.agent.create(**config)
     console.print(f"[bold green]✓ created agent:[/bold green] {response}")
 
 
 @app.command("update-agent")
-def update_agent(agent_id: str, update_json: str = typer.Option(..., "--data", "-d", help="json string with update data")):
+def update_agent(
+    agent_id: str,
+    update_json: Optional[str] = typer.Option(None, "--data", "-d", help="json string with update data"),
+    from_file: Optional[Path] = typer.Option(None, "--file", "-f", help="json file with update data"),
+):
     """
-    update an agent using a JSON string
+    update an agent using a JSON string or file
     """
-    try:
-        data = json.loads(update_json)
-    except Exception as e:
-        console.print(f"[red]invalid json: {e}[/red]")
+    if from_file:
+        data = load_json_file(from_file)
+    elif update_json:
+        try:
+            data = _json.loads(update_json)
+        except Exception as e:
+            console.print(f"[red]invalid json: {e}[/red]")
+            raise typer.Exit()
+    else:
+        console.print("[red]pass the update with --data or --file[/red]")
         raise typer.Exit()
 
     client = get_client()
@@ -1,6 +1,29 @@
 import requests
 import json
-from urllib.parse import urljoin
+import copy
+import gzip
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
+from urllib.parse import urljoin, urlsplit
+from urllib3.util.retry import Retry
+from urllib3.util.request import ACCEPT_ENCODING
+
+from ._adapters import KeepAliveAdapter, PinnedResolver, keepalive_socket_options
+from ._breaker import CircuitBreaker
+from ._cache import TTLCache
+from ._singleflight import SingleFlight
+from . import _json
+
+logger = logging.getLogger(__name__)
+
+# Bytes read from the socket at a time when streaming a response
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Listings revalidated with their ETag unless cache_ttl says otherwise
+DEFAULT_CACHE_TTL = {"agents": 0, "simulations": 0}
 
 class APIError(Exception):
     """Exception raised for API errors."""
@@ -11,33 +34,158 @@ class APIError(Exception):
         super().__init__(f"API Error ({status_code}): {message}")
 
 class Client(object):
-    def __init__(self, api_key, base_url='https://backend.omnidim.io/api/v1'):
+    def __init__(self, api_key, base_url='https://backend.omnidim.io/api/v1', cache_ttl=None, cache_size=1024,
+                 http2=None, max_workers=32, pin_dns=False, pool_connections=None, pool_maxsize=50,
+                 gzip_threshold=None, circuit_breaker=False, warmup=False):
         """
         Initialize the OmniClient with API key and base URL.
 
         Args:
             api_key (str): The API key for authentication.
             base_url (str): The base URL of the API.
+            cache_ttl (dict, optional): Seconds to cache GET responses per endpoint,
+                e.g. {"integrations": 300, "agents": 60}. A key applies to that
+                endpoint and everything below it; the most specific key wins.
+                A TTL of 0 revalidates on every call: the request carries the
+                cached ETag and a 304 reuses the stored body without decoding it.
+                A successful POST, PUT or DELETE drops the cached responses of the
+                resource it touched. The entries given are merged over
+                DEFAULT_CACHE_TTL, which revalidates agents and simulations;
+                map an endpoint to None to stop caching it.
+            cache_size (int): Maximum number of cached GET responses (default: 1024).
+            http2 (bool): Send requests over HTTP/2 so concurrent calls multiplex on one
+                connection. Requires the optional httpx dependency; servers that don't
+                offer h2 are spoken to over HTTP/1.1. Idempotent requests are retried on
+                429/5xx as on the default session, and like it no timeout is applied.
+                pin_dns and pool_connections can't be combined with it. When not given,
+                OMNIDIM_HTTP2=1 in the environment turns it on; OMNIDIM_PREFER_HTTP1=1
+                always turns it off (default: off).
+            max_workers (int): Size of the thread pool used by submit() (default: 32).
+            pin_dns (bool): Resolve the API host once and reuse the address for new
+                connections, re-resolving every 5 minutes (default: False).
+            pool_connections (int, optional): Number of per-host connection pools to keep
+                (default: 10).
+            pool_maxsize (int): Keep-alive connections kept per host; match it to the
+                concurrency you use with submit() (default: 50).
+            gzip_threshold (int, optional): Gzip JSON request bodies larger than this many
+                bytes and send them with Content-Encoding: gzip. Only enable it against
+                servers that accept compressed requests (default: disabled).
+            circuit_breaker (bool): After 5 consecutive failed requests (network errors,
+                429 or 5xx once retries are used up), fail fast with an APIError for 30
+                seconds instead of calling the API (default: False).
+            warmup (bool): Start connecting to the API in the background as soon as the
+                client is built, so the first call skips DNS and the TLS handshake
+                (default: False). See warmup().
         """
         if not api_key:
             raise ValueError("API key is required.")
         
         self.api_key = api_key
         self.base_url = base_url.rstrip('/')
-        print(self.base_url)
-        # Lazy-loaded domain clients
-        self._agent = None
-        self._call = None
-        self._integrations = None
-        self._knowledge_base = None
-        self._phone_number = None
-        self._simulation = None
-        
+        # Request URLs are this prefix plus the endpoint path
+        self._base = self.base_url + '/'
+        logger.debug("Using API base URL %s", self.base_url)
+
+        # Shared HTTP session so every domain client reuses keep-alive connections
+        if http2 is None:
+            http2 = os.environ.get('OMNIDIM_HTTP2') == '1'
+        if http2 and os.environ.get('OMNIDIM_PREFER_HTTP1') == '1':
+            logger.debug("OMNIDIM_PREFER_HTTP1 is set, using HTTP/1.1")
+            http2 = False
+        self._http2 = http2
+        if http2:
+            # httpx keeps one pool and resolves hosts itself, so these have nothing to apply to
+            if pin_dns or pool_connections is not None:
+                raise ValueError("pin_dns and pool_connections are not supported with http2.")
+            self._session = self._create_http2_session(pool_maxsize=pool_maxsize)
+        else:
+            if pool_connections is None:
+                pool_connections = 10
+            self._session = self._create_session(pin_dns=pin_dns, pool_connections=pool_connections,
+                                                 pool_maxsize=pool_maxsize)
+        self._session.headers.update({
+            'Authorization': f'Bearer {api_key}',
+            'Content-Type': 'application/json',
+            'Accept': 'application/json',
+        })
+
+        self._gzip_threshold = gzip_threshold
+        self._breaker = CircuitBreaker() if circuit_breaker else None
+
+        # Concurrent identical GETs are coalesced into one request
+        self._inflight = SingleFlight()
+
+        # Response cache for idempotent GETs
+        self._cache_ttl = dict(DEFAULT_CACHE_TTL, **(cache_ttl or {}))
+        self._cache = TTLCache(maxsize=cache_size)
+
+        # Thread pool for concurrent calls, created on first submit()
+        self._max_workers = max_workers
+        self._executor = None
+        self._executor_lock = threading.Lock()
+
         # Verify API key format (basic validation)
         if not isinstance(api_key, str) or len(api_key.strip()) < 8:
             raise ValueError("API key appears to be invalid. Please check your credentials.")
 
-    def request(self, method, endpoint, params=None, headers=None, data=None, json_data=None):
+        if warmup:
+            self.warmup()
+
+    def _create_session(self, pin_dns=False, pool_connections=10, pool_maxsize=50):
+        """Build the default requests session with a keep-alive pool and retries."""
+        session = requests.Session()
+        # Advertise every codec urllib3 can decode here (brotli/zstd when installed)
+        session.headers['Accept-Encoding'] = ACCEPT_ENCODING
+        # Only idempotent methods are retried, so a POST such as a call dispatch is never sent twice
+        retries = Retry(
+            total=3,
+            backoff_factor=0.2,
+            status_forcelist=[429, 500, 502, 503, 504],
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        # TCP keepalive keeps idle pooled connections from being dropped by NATs/firewalls
+        resolver = None
+        if pin_dns:
+            # Resolve up front so the first request doesn't pay for the lookup
+            resolver = PinnedResolver()
+            parts = urlsplit(self.base_url)
+            resolver.resolve(parts.hostname, parts.port or (443 if parts.scheme == 'https' else 80))
+        adapter = KeepAliveAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize,
+                                   max_retries=retries, resolver=resolver)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        self._status_errors = (requests.exceptions.HTTPError,)
+        self._network_errors = (requests.exceptions.RequestException,)
+        self._content_kwarg = 'data'
+        return session
+
+    def _create_http2_session(self, pool_maxsize=50):
+        """Build an httpx client that multiplexes requests over HTTP/2."""
+        try:
+            import httpx
+            from ._http2 import RetryTransport
+        except ImportError:
+            raise ImportError(
+                "HTTP/2 support requires httpx. Install it with: pip install omnidimension[http2]"
+            )
+        # httpx only retries failed connects itself; 429/5xx answers are retried on top
+        # Same keep-alive pool size and TCP keepalive probes as the requests session;
+        # like urllib3's pool, extra connections are opened past it rather than waited for
+        transport = RetryTransport(httpx.HTTPTransport(
+            http2=True,
+            retries=3,
+            limits=httpx.Limits(max_keepalive_connections=pool_maxsize, max_connections=None),
+            socket_options=keepalive_socket_options(),
+        ))
+        self._status_errors = (httpx.HTTPStatusError,)
+        self._network_errors = (httpx.HTTPError,)
+        self._content_kwarg = 'content'
+        # No timeout, matching the requests session, so large uploads aren't cut off
+        return httpx.Client(transport=transport, timeout=None)
+
+    def request(self, method, endpoint, params=None, headers=None, data=None, json_data=None, content=None,
+                raw=False):
         """
         Universal request method to handle all API requests.
 
@@ -48,138 +196,328 @@ class Client(object):
             headers (dict, optional): HTTP headers
             data (dict, optional): Form data
             json_data (dict, optional): JSON data
+            content (bytes, optional): Pre-serialized JSON body, sent as-is instead of json_data
+            raw (bool): Return the response body as bytes without decoding it (default: False)
 
         Returns:
-            dict: Response with status code and JSON data
+            dict: Response with status code and JSON data, or bytes if raw is set
 
         Raises:
             APIError: If the API returns an error status code
             requests.exceptions.RequestException: For network-related errors
         """
-        # Prepare request
-        headers = headers or {}
-        params = params or {}
         method = method.upper()
+        if method == "GET" and not headers:
+            # Identical GETs already in flight share one round trip
+            key = (endpoint.strip('/'), tuple(sorted((k, str(v)) for k, v in (params or {}).items())), raw)
+            return self._inflight.do(key, lambda: self._request(method, endpoint, params, headers, data,
+                                                                json_data, content, raw))
+        return self._request(method, endpoint, params, headers, data, json_data, content, raw)
+
+    def _request(self, method, endpoint, params, headers, data, json_data, content, raw):
+        """Send a request; see request() for the arguments."""
+        # Prepare request (auth and content headers live on the session); requests
+        # skips None params but httpx would send them as empty strings
+        params = {k: v for k, v in (params or {}).items() if v is not None}
+        
+        # Serve cached GETs, revalidating stale entries with their ETag
+        cache_key = None
+        cache_entry = None
+        ttl = self._cache_ttl_for(endpoint) if method == "GET" else None
+        if ttl is not None:
+            cache_key = (endpoint.strip('/'), tuple(sorted((k, str(v)) for k, v in params.items())), raw)
+            cache_entry = self._cache.get(cache_key)
+            if cache_entry is not None:
+                if cache_entry.is_fresh():
+                    return copy.deepcopy(cache_entry.value)
+                if cache_entry.etag:
+                    headers = dict(headers or {})
+                    headers['If-None-Match'] = cache_entry.etag
         
-        # Add authorization header
-        headers.setdefault('Authorization', f'Bearer {self.api_key}')
-        headers.setdefault('Content-Type', 'application/json')
-        headers.setdefault('Accept', 'application/json')
+        # Serialize JSON bodies ourselves so the faster codec is used when installed
+        if content is None and json_data is not None:
+            content = _json.dumps(json_data)
+        if (self._gzip_threshold is not None and isinstance(content, bytes)
+                and len(content) > self._gzip_threshold):
+            content = gzip.compress(content, compresslevel=6)
+            headers = dict(headers or {})
+            headers['Content-Encoding'] = 'gzip'
+        body = {'data': data}
+        if content is not None:
+            body[self._content_kwarg] = content
         
         # Build full URL
-        url = self.base_url + '/' + endpoint.lstrip('/')
-        print("->",url, self.base_url, endpoint)
+        url = self._base + endpoint.lstrip('/')
+        logger.debug("%s %s", method, url)
+        self._check_breaker()
         try:
-            # Make the request
-            response = requests.request(
+            # Make the request over the pooled session
+            response = self._session.request(
                 method=method,
                 url=url,
                 params=params,
                 headers=headers,
-                data=data,
-                json=json_data
+                **body
             )
+            self._record_outcome(response.status_code)
+            
+            # Unchanged since the cached copy was stored
+            if response.status_code == 304 and cache_entry is not None:
+                cache_entry.refresh(ttl)
+                return copy.deepcopy(cache_entry.value)
             
             # Check for HTTP errors
             response.raise_for_status()
             
             # Process response based on method
-            if method == "DELETE":
-                json_response = {}
+            if raw:
+                result = response.content
             else:
-                json_response = response.json() if response.content else {}
-                
-            return {
-                "status": response.status_code,
-                "json": json_response
-            }
+                if method == "DELETE":
+                    json_response = {}
+                else:
+                    try:
+                        json_response = _json.loads(response.content) if response.content else {}
+                    except ValueError as e:
+                        # e.g. an HTML page from a proxy in front of the API
+                        raise APIError(
+                            status_code=response.status_code,
+                            message=f"Invalid JSON in response: {str(e)}"
+                        )
+                    
+                result = {
+                    "status": response.status_code,
+                    "json": json_response
+                }
+            if cache_key is not None:
+                etag = response.headers.get('ETag')
+                # With a TTL of 0 an entry is only useful if it can be revalidated
+                if ttl > 0 or etag:
+                    self._cache.set(cache_key, copy.deepcopy(result), ttl, etag=etag)
+            elif method != "GET":
+                # A write may change both the item and the listings it appears in
+                self._cache.invalidate(endpoint.strip('/').split('/', 1)[0])
+            return result
             
-        except requests.exceptions.HTTPError as e:
+        except self._status_errors as e:
             # Handle API errors with response
-            error_message = "Unknown error"
-            error_data = {}
+            raise self._status_error(e)
             
-            try:
-                error_data = e.response.json()
-                error_message = error_data.get('error_description', error_data.get('error', str(e)))
-            except (ValueError, AttributeError, KeyError):
-                error_message = str(e)
-                
+        except self._network_errors as e:
+            # Handle network errors
+            self._record_outcome(None)
             raise APIError(
-                status_code=e.response.status_code,
-                message=error_message,
-                response=error_data
+                status_code=0,
+                message=f"Network error: {str(e)}"
             )
-            
-        except requests.exceptions.RequestException as e:
-            # Handle network errors
+
+    def iter_items(self, endpoint, items_key, params=None, headers=None):
+        """
+        Stream a GET response and yield the items of one of its lists as they arrive.
+
+        With the optional ijson dependency installed the body is parsed while it
+        downloads, so a large page is never decoded into a single dict; without
+        it the body is decoded in one go. Streamed responses bypass the cache.
+
+        Args:
+            endpoint (str): API endpoint path (without base URL)
+            items_key (str): Top-level key of the list to iterate, e.g. "bots"
+            params (dict, optional): URL parameters
+            headers (dict, optional): HTTP headers
+
+        Yields:
+            dict: Each element of the list, in order.
+
+        Raises:
+            APIError: If the API returns an error status code or the connection fails
+        """
+        url = self._base + endpoint.lstrip('/')
+        params = {k: v for k, v in (params or {}).items() if v is not None}
+        logger.debug("GET %s (streamed)", url)
+        self._check_breaker()
+        try:
+            if self._http2:
+                stream = self._session.stream("GET", url, params=params, headers=headers)
+            else:
+                stream = self._session.get(url, params=params, headers=headers, stream=True)
+            with stream as response:
+                self._record_outcome(response.status_code)
+                try:
+                    response.raise_for_status()
+                except self._status_errors as e:
+                    # Build the error while the body can still be read
+                    if self._http2:
+                        response.read()
+                    raise self._status_error(e)
+                if self._http2:
+                    chunks = response.iter_bytes()
+                else:
+                    chunks = response.iter_content(STREAM_CHUNK_SIZE)
+                for item in _json.iter_items(chunks, items_key):
+                    yield item
+
+        except self._network_errors as e:
+            self._record_outcome(None)
             raise APIError(
                 status_code=0,
                 message=f"Network error: {str(e)}"
             )
+
+    def _check_breaker(self):
+        """Raise an APIError instead of sending a request while the circuit breaker is open."""
+        if self._breaker is not None and not self._breaker.allow():
+            raise APIError(
+                status_code=0,
+                message="Circuit open after repeated failures, retry in %.0fs" % self._breaker.retry_in()
+            )
+
+    def _record_outcome(self, status_code):
+        """Feed a response status (None for a network error) to the circuit breaker."""
+        if self._breaker is not None:
+            self._breaker.record(status_code is not None and status_code < 500 and status_code != 429)
+
+    def _status_error(self, e):
+        """Build an APIError from an HTTP status error raised by the session."""
+        error_message = "Unknown error"
+        error_data = {}
+        
+        try:
+            error_data = _json.loads(e.response.content)
+            error_message = error_data.get('error_description', error_data.get('error', str(e)))
+        except (ValueError, AttributeError, KeyError):
+            error_message = str(e)
+            
+        return APIError(
+            status_code=e.response.status_code,
+            message=error_message,
+            response=error_data
+        )
     
+    def _cache_ttl_for(self, endpoint):
+        """Return the cache TTL configured for endpoint, or None if it isn't cached."""
+        path = endpoint.strip('/')
+        while path:
+            if path in self._cache_ttl:
+                # An explicit None turns caching off for this subtree
+                return self._cache_ttl[path]
+            path = path.rpartition('/')[0]
+        return None
+
+    def clear_cache(self):
+        """Drop every cached GET response."""
+        self._cache.clear()
+
+    def warmup(self):
+        """
+        Open a connection to the API in the background, ahead of the first call.
+
+        DNS lookup and the TLS handshake happen on a daemon thread, and the
+        connection is left in the session's pool for the next request to reuse.
+        Failures are ignored; the first real call then connects as usual.
+        """
+        def connect():
+            try:
+                self._session.head(self._base, timeout=2)
+            except Exception as e:
+                logger.debug("Connection warmup failed: %s", e)
+
+        threading.Thread(target=connect, name="omnidim-warmup", daemon=True).start()
+
+    def batch(self):
+        """
+        Start a batch of SDK calls that run together over the pooled session.
+
+        Returns:
+            Batch: A new, empty batch bound to this client.
+        """
+        from .batch import Batch
+        return Batch(self)
+
+    def submit(self, fn, /, *args, **kwargs):
+        """
+        Run an SDK call on the client's shared thread pool.
+
+        Calls share the pooled session, so many submitted calls reuse the same
+        keep-alive connections instead of opening new ones.
+
+        Args:
+            fn (callable): Bound SDK method, e.g. client.call.dispatch_call. Positional-only,
+                so methods that take their own method= keyword can be submitted.
+            *args: Positional arguments for fn.
+            **kwargs: Keyword arguments for fn.
+
+        Returns:
+            concurrent.futures.Future: Future resolving to fn's result.
+        """
+        if self._executor is None:
+            with self._executor_lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(max_workers=self._max_workers)
+        return self._executor.submit(fn, *args, **kwargs)
+
+    def close(self):
+        """Wait for submitted calls, then close the HTTP session and release pooled connections."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        self._session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
     # Convenience methods for different HTTP methods
-    def get(self, endpoint, params=None, headers=None):
+    def get(self, endpoint, params=None, headers=None, raw=False):
         """Make a GET request to the API."""
-        return self.request("GET", endpoint, params=params, headers=headers)
+        return self.request("GET", endpoint, params=params, headers=headers, raw=raw)
     
-    def post(self, endpoint, data=None, params=None, headers=None):
+    def post(self, endpoint, data=None, params=None, headers=None, content=None):
         """Make a POST request to the API."""
-        return self.request("POST", endpoint, params=params, headers=headers, json_data=data)
+        return self.request("POST", endpoint, params=params, headers=headers, json_data=data, content=content)
     
-    def put(self, endpoint, data=None, params=None, headers=None):
+    def put(self, endpoint, data=None, params=None, headers=None, content=None):
         """Make a PUT request to the API."""
-        return self.request("PUT", endpoint, params=params, headers=headers, json_data=data)
+        return self.request("PUT", endpoint, params=params, headers=headers, json_data=data, content=content)
     
     def delete(self, endpoint, params=None, headers=None):
         """Make a DELETE request to the API."""
         return self.request("DELETE", endpoint, params=params, headers=headers)
     
-    # Domain-specific clients (lazy-loaded)
-    @property
+    # Domain-specific clients, each built on first access
+    @cached_property
     def agent(self):
         """Get the Agent client."""
-        if self._agent is None:
-            from .Agent import Agent
-            self._agent = Agent(self)
-        return self._agent
+        from .Agent import Agent
+        return Agent(self)
 
-    @property
+    @cached_property
     def call(self):
         """Get the Callback client."""
-        if self._call is None:
-            from .Call import Call
-            self._call = Call(self)
-        return self._call
+        from .Call import Call
+        return Call(self)
 
-    @property
+    @cached_property
     def integrations(self):
         """Get the Integrations client."""
-        if self._integrations is None:
-            from .Integrations import Integrations
-            self._integrations = Integrations(self)
-        return self._integrations
-        
-    @property
+        from .Integrations import Integrations
+        return Integrations(self)
+
+    @cached_property
     def knowledge_base(self):
         """Get the KnowledgeBase client."""
-        if self._knowledge_base is None:
-            from .KnowledgeBase import KnowledgeBase
-            self._knowledge_base = KnowledgeBase(self)
-        return self._knowledge_base
-        
-    @property
+        from .KnowledgeBase import KnowledgeBase
+        return KnowledgeBase(self)
+
+    @cached_property
     def phone_number(self):
         """Get the PhoneNumber client."""
-        if self._phone_number is None:
-            from .PhoneNumber import PhoneNumber
-            self._phone_number = PhoneNumber(self)
-        return self._phone_number
+        from .PhoneNumber import PhoneNumber
+        return PhoneNumber(self)
 
-    @property
+    @cached_property
     def simulation(self):
         """Get the Simulation client."""
-        if self._simulation is None:
-            from .Simulation import Simulation
-            self._simulation = Simulation(self)
-        return self._simulation
\ No newline at end of file
+        from .Simulation import Simulation
+        return Simulation(self)
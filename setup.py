@@ -6,8 +6,12 @@ setup(
     packages=find_packages() + ["omnidim_mcp_server"],
     install_requires=["requests"],
     extras_require={
-        "mcp": ["fastapi>=0.95.0", "uvicorn>=0.21.0", "fastmcp>=0.1.0", "pydantic>=1.10.0"],
-        "cli": ["typer>=0.9.0", "rich>=13.7.0"]
+        "mcp": ["fastapi>=0.95.0", "uvicorn>=0.21.0", "fastmcp>=0.1.0", "pydantic>=1.10.0", "httpx[http2]>=0.24.0"],
+        "cli": ["typer>=0.9.0", "rich>=13.7.0"],
+        "http2": ["httpx[http2]>=0.24.0"],
+        "compression": ["urllib3[brotli,zstd]"],
+        "orjson": ["orjson>=3.6"],
+        "streaming": ["ijson>=3.1"]
     },
     entry_points={
         "console_scripts": [
@@ -26,5 +30,5 @@ setup(
         "License :: OSI Approved :: MIT License",
         "Operating System :: OS Independent",
     ],
-    python_requires=">=3.6",
+    python_requires=">=3.8",
 )
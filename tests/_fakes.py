@@ -0,0 +1,22 @@
+import json
+
+import requests
+
+
+def fake_response(payload=None, status_code=200):
+    """Build a requests.Response carrying payload as its JSON body."""
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = json.dumps(payload if payload is not None else {}).encode('utf-8')
+    return response
+
+
+class RecordingSession(object):
+    """Stands in for Client._session.request, recording every call it gets."""
+    def __init__(self, respond=None):
+        self.calls = []
+        self._respond = respond or (lambda method, url, **kwargs: fake_response({"ok": True}))
+
+    def __call__(self, method, url, **kwargs):
+        self.calls.append((method, url, kwargs))
+        return self._respond(method, url, **kwargs)
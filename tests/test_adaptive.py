@@ -0,0 +1,82 @@
+import time
+import unittest
+from unittest import mock
+
+from omnidimension import AIMDLimiter, APIError, Client
+
+from ._fakes import RecordingSession, fake_response
+
+API_KEY = "test-api-key"
+
+
+def fail(status_code):
+    raise APIError(status_code, "boom")
+
+
+class AIMDLimiterTest(unittest.TestCase):
+    def call_failing(self, limiter, status_code):
+        with self.assertRaises(APIError):
+            limiter.call(fail, status_code)
+
+    def test_slow_successes_never_lower_the_limit(self):
+        limiter = AIMDLimiter(initial=8)
+        for _ in range(5):
+            limiter.call(time.sleep, 0.01)
+        self.assertGreaterEqual(limiter.limit, 8)
+
+    def test_overload_signals_shrink_the_limit(self):
+        for status_code in (429, 503, 0):
+            limiter = AIMDLimiter(initial=8)
+            self.call_failing(limiter, status_code)
+            self.assertEqual(limiter.limit, 4)
+
+    def test_client_errors_leave_the_limit_alone(self):
+        limiter = AIMDLimiter(initial=8)
+        self.call_failing(limiter, 404)
+        with self.assertRaises(ValueError):
+            limiter.call(int, "not a number")
+        self.assertEqual(limiter.limit, 8)
+
+    def test_recovers_after_an_overloaded_period(self):
+        limiter = AIMDLimiter(initial=8, maximum=16)
+        for _ in range(5):
+            self.call_failing(limiter, 503)
+        self.assertEqual(limiter.limit, 1)
+        for _ in range(40):
+            limiter.call(lambda: None)
+        self.assertGreaterEqual(limiter.limit, 8)
+
+    def test_rejects_inconsistent_bounds(self):
+        with self.assertRaises(ValueError):
+            AIMDLimiter(initial=100, maximum=64)
+        with self.assertRaises(ValueError):
+            AIMDLimiter(decrease=1.5)
+
+
+class SimulationLimiterTest(unittest.TestCase):
+    def setUp(self):
+        self.client = Client(API_KEY)
+        self.addCleanup(self.client.close)
+
+    def test_create_bulk_uses_the_given_limiter(self):
+        session = RecordingSession()
+        limiter = AIMDLimiter(initial=2, maximum=4)
+        specs = [{"name": f"sim {i}", "agent_id": 1} for i in range(6)]
+        with mock.patch.object(self.client._session, 'request', session):
+            results = self.client.simulation.create_bulk(specs, limiter=limiter)
+        self.assertEqual(len(results), 6)
+        self.assertEqual(len(session.calls), 6)
+        self.assertGreater(limiter.limit, 2)
+        # The shared limiter was not touched
+        self.assertEqual(self.client.simulation._limiter.limit, 8)
+
+    def test_run_many_without_a_limiter(self):
+        session = RecordingSession(lambda method, url, **kwargs: fake_response({}, status_code=503))
+        with mock.patch.object(self.client._session, 'request', session):
+            results = self.client.simulation.run_many("get", [1, 2, 3], limiter=False, return_exceptions=True)
+        self.assertTrue(all(isinstance(r, APIError) for r in results))
+        self.assertEqual(self.client.simulation._limiter.limit, 8)
+
+
+if __name__ == '__main__':
+    unittest.main()
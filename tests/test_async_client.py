@@ -0,0 +1,66 @@
+import asyncio
+import inspect
+import threading
+import unittest
+from unittest import mock
+
+from omnidimension import AsyncClient, _json
+
+from ._fakes import RecordingSession, fake_response
+
+API_KEY = "test-api-key"
+
+
+class AsyncIteratorTest(unittest.TestCase):
+    def test_iterators_become_async_generators_off_the_loop(self):
+        pages = {1: [{"id": 1}, {"id": 2}], 2: [{"id": 3}]}
+        threads = []
+
+        def respond(method, url, **kwargs):
+            threads.append(threading.get_ident())
+            return fake_response({"bots": pages[kwargs["params"]["pageno"]]})
+
+        async def collect():
+            client = AsyncClient(API_KEY)
+            with mock.patch.object(client._client._session, 'request', RecordingSession(respond)):
+                agents = client.agent.iter(page_size=2)
+                self.assertTrue(inspect.isasyncgen(agents))
+                items = [agent async for agent in agents]
+            await client.close()
+            return items
+
+        loop_thread = threading.get_ident()
+        items = asyncio.run(asyncio.wait_for(collect(), timeout=10))
+        self.assertEqual([item["id"] for item in items], [1, 2, 3])
+        self.assertEqual(len(threads), 2)
+        self.assertNotIn(loop_thread, threads)
+
+    def test_other_methods_stay_coroutines(self):
+        async def fetch():
+            client = AsyncClient(API_KEY)
+            with mock.patch.object(client._client._session, 'request', RecordingSession()):
+                pending = client.agent.list()
+                self.assertTrue(inspect.iscoroutine(pending))
+                result = await pending
+            await client.close()
+            return result
+
+        self.assertEqual(asyncio.run(fetch())["json"], {"ok": True})
+
+    def test_methods_taking_a_method_keyword(self):
+        session = RecordingSession()
+
+        async def create():
+            client = AsyncClient(API_KEY)
+            with mock.patch.object(client._client._session, 'request', session):
+                await client.integrations.create_custom_api_integration(
+                    name="Weather", url="https://example.com/weather", method="GET")
+            await client.close()
+
+        asyncio.run(asyncio.wait_for(create(), timeout=10))
+        body = _json.loads(session.calls[0][2]['data'])
+        self.assertEqual(body['method'], "GET")
+
+
+if __name__ == '__main__':
+    unittest.main()
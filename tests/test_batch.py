@@ -0,0 +1,78 @@
+import asyncio
+import unittest
+from unittest import mock
+
+from omnidimension import AsyncClient, Client, _json
+
+from ._fakes import RecordingSession
+
+API_KEY = "test-api-key"
+
+
+class NestedBatchTest(unittest.TestCase):
+    def test_batches_inside_submitted_calls_do_not_deadlock(self):
+        client = Client(API_KEY, max_workers=2)
+        self.addCleanup(client.close)
+
+        def outer(n):
+            batch = client.batch()
+            for i in range(3):
+                batch.add(lambda i: n * 10 + i, i)
+            return batch.execute(concurrent=True)
+
+        # More outer calls than workers, each waiting on its own batch
+        futures = [client.submit(outer, n) for n in range(4)]
+        results = [future.result(timeout=10) for future in futures]
+        self.assertEqual(results, [[n * 10, n * 10 + 1, n * 10 + 2] for n in range(4)])
+
+    def test_nested_batches(self):
+        client = Client(API_KEY, max_workers=2)
+        self.addCleanup(client.close)
+
+        def inner(n):
+            batch = client.batch()
+            for i in range(3):
+                batch.add(pow, n, i)
+            return batch.execute(concurrent=True, max_concurrency=1)
+
+        batch = client.batch()
+        for n in range(4):
+            batch.add(inner, n)
+        self.assertEqual(batch.execute(concurrent=True, max_concurrency=2),
+                         [[1, n, n * n] for n in range(4)])
+
+    def test_gathered_bulk_helpers_on_small_async_pool(self):
+        async def run():
+            client = AsyncClient(API_KEY, max_workers=2)
+            session = RecordingSession()
+            with mock.patch.object(client._client._session, 'request', session):
+                numbers = ["+15550000001", "+15550000002", "+15550000003"]
+                results = await asyncio.wait_for(asyncio.gather(
+                    client.call.dispatch_calls(1, numbers),
+                    client.call.dispatch_calls(2, numbers),
+                ), timeout=10)
+            await client.close()
+            return results, session
+
+        results, session = asyncio.run(run())
+        self.assertEqual([len(r) for r in results], [3, 3])
+        self.assertEqual(len(session.calls), 6)
+
+
+class BatchAddTest(unittest.TestCase):
+    def test_queues_methods_taking_a_method_keyword(self):
+        client = Client(API_KEY)
+        self.addCleanup(client.close)
+        session = RecordingSession()
+        batch = client.batch()
+        for verb in ("GET", "POST"):
+            batch.add(client.integrations.create_custom_api_integration,
+                      name="Hook", url="https://example.com/hook", method=verb)
+        with mock.patch.object(client._session, 'request', session):
+            batch.execute(concurrent=True)
+        sent = sorted(_json.loads(call[2]['data'])['method'] for call in session.calls)
+        self.assertEqual(sent, ["GET", "POST"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,105 @@
+import threading
+import time
+import unittest
+from unittest import mock
+
+from omnidimension import Client
+
+from ._fakes import RecordingSession, fake_response
+
+API_KEY = "test-api-key"
+
+
+class ETagServer(object):
+    """Answers GETs with an ETag'd body and 304 when the client already holds it."""
+    def __init__(self):
+        self.version = 1
+
+    def __call__(self, method, url, **kwargs):
+        etag = f'"v{self.version}"'
+        if method != "GET":
+            self.version += 1
+            return fake_response({"ok": True})
+        if (kwargs.get('headers') or {}).get('If-None-Match') == etag:
+            response = fake_response(status_code=304)
+            response._content = b""
+        else:
+            response = fake_response({"bots": [{"id": 1}], "version": self.version})
+        response.headers['ETag'] = etag
+        return response
+
+
+class ResponseCacheTest(unittest.TestCase):
+    def client_for(self, respond, **options):
+        client = Client(API_KEY, **options)
+        self.addCleanup(client.close)
+        session = RecordingSession(respond)
+        patcher = mock.patch.object(client._session, 'request', session)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        return client, session
+
+    def sent_etags(self, session):
+        return [(kwargs.get('headers') or {}).get('If-None-Match') for _, _, kwargs in session.calls]
+
+    def test_unchanged_listing_is_revalidated_and_reused(self):
+        client, session = self.client_for(ETagServer())
+        first = client.agent.list()
+        first["json"]["bots"].append({"id": 2})
+        second = client.agent.list()
+        self.assertEqual(second["json"]["bots"], [{"id": 1}])
+        self.assertEqual(second["status"], 200)
+        self.assertEqual(self.sent_etags(session), [None, '"v1"'])
+
+    def test_write_drops_the_cached_listing(self):
+        client, session = self.client_for(ETagServer())
+        client.agent.list()
+        client.agent.update(1, {"name": "renamed"})
+        self.assertEqual(client.agent.list()["json"]["version"], 2)
+        self.assertEqual(self.sent_etags(session), [None, None, None])
+
+    def test_none_opts_an_endpoint_out(self):
+        client, session = self.client_for(ETagServer(), cache_ttl={"agents": None})
+        client.agent.list()
+        client.agent.list()
+        self.assertEqual(self.sent_etags(session), [None, None])
+        self.assertEqual(len(client._cache), 0)
+
+    def test_fresh_entries_skip_the_request(self):
+        client, session = self.client_for(None, cache_ttl={"integrations": 60})
+        client.get("integrations/user")
+        client.get("integrations/user")
+        self.assertEqual(len(session.calls), 1)
+
+
+class SingleFlightTest(unittest.TestCase):
+    def test_identical_concurrent_gets_share_one_request(self):
+        client = Client(API_KEY, max_workers=4)
+        self.addCleanup(client.close)
+        release = threading.Event()
+
+        def respond(method, url, **kwargs):
+            release.wait(timeout=10)
+            return fake_response({"phone_numbers": [{"id": 1}]})
+
+        session = RecordingSession(respond)
+        with mock.patch.object(client._session, 'request', session):
+            futures = [client.submit(client.get, "phone_number/list") for _ in range(4)]
+            # Let the three followers join the leader's flight before it completes
+            deadline = time.monotonic() + 10
+            while time.monotonic() < deadline:
+                flights = list(client._inflight._flights.values())
+                if flights and flights[0].waiters == 3:
+                    break
+                time.sleep(0.01)
+            release.set()
+            results = [future.result(timeout=10) for future in futures]
+
+        self.assertEqual(len(session.calls), 1)
+        self.assertTrue(all(result == results[0] for result in results))
+        # Every caller gets its own copy
+        self.assertEqual(len({id(result) for result in results}), 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,143 @@
+import threading
+import unittest
+from unittest import mock
+
+import requests
+
+from omnidimension import APIError, Client, _json
+
+from ._fakes import RecordingSession, fake_response
+
+API_KEY = "test-api-key"
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+
+@unittest.skipIf(httpx is None, "httpx is not installed")
+class HTTP2ParamsTest(unittest.TestCase):
+    def setUp(self):
+        self.urls = []
+        self.client = Client(API_KEY, http2=True)
+        self.addCleanup(self.client.close)
+        self.client._session.close()
+
+        def handler(request):
+            self.urls.append(request.url)
+            return httpx.Response(200, json={"call_log_data": []})
+
+        self.client._session = httpx.Client(transport=httpx.MockTransport(handler))
+
+    def test_none_params_are_not_sent(self):
+        self.client.call.get_call_logs(page=2)
+        url = self.urls[-1]
+        self.assertNotIn("agentid", url.params)
+        self.assertEqual(url.params["pageno"], "2")
+
+    def test_streamed_none_params_are_not_sent(self):
+        self.assertEqual(list(self.client.call.iter_call_logs()), [])
+        self.assertNotIn("agentid", self.urls[-1].params)
+
+
+@unittest.skipIf(httpx is None, "httpx is not installed")
+class HTTP2OptionsTest(unittest.TestCase):
+    def test_rejects_options_of_the_requests_session(self):
+        for options in ({"pin_dns": True}, {"pool_connections": 4}):
+            with self.assertRaises(ValueError):
+                Client(API_KEY, http2=True, **options)
+
+    def test_honours_pool_size_without_a_timeout(self):
+        client = Client(API_KEY, http2=True, pool_maxsize=7)
+        self.addCleanup(client.close)
+        self.assertIsNone(client._session.timeout.read)
+        pool = client._session._transport._transport._pool
+        self.assertEqual(pool._max_keepalive_connections, 7)
+
+
+@unittest.skipIf(httpx is None, "httpx is not installed")
+class HTTP2RetryTest(unittest.TestCase):
+    def client_answering(self, *statuses):
+        """Build an HTTP/2 client whose server answers with statuses in turn."""
+        self.methods = []
+        answers = iter(statuses)
+
+        def handler(request):
+            self.methods.append(request.method)
+            return httpx.Response(next(answers), headers={"Retry-After": "0"}, json={"ok": True})
+
+        with mock.patch.object(httpx, 'HTTPTransport', lambda **kwargs: httpx.MockTransport(handler)):
+            client = Client(API_KEY, http2=True, circuit_breaker=True)
+        self.addCleanup(client.close)
+        return client
+
+    def test_retries_transient_errors_on_idempotent_requests(self):
+        client = self.client_answering(503, 429, 200)
+        self.assertEqual(client.get("agents/1")["status"], 200)
+        self.assertEqual(self.methods, ["GET"] * 3)
+
+    def test_gives_up_after_three_retries(self):
+        client = self.client_answering(503, 503, 503, 503)
+        with self.assertRaises(APIError) as raised:
+            client.get("agents/1")
+        self.assertEqual(raised.exception.status_code, 503)
+        self.assertEqual(len(self.methods), 4)
+
+    def test_never_resends_a_post(self):
+        client = self.client_answering(503, 200)
+        with self.assertRaises(APIError):
+            client.post("calls/dispatch", data={"agent_id": 1})
+        self.assertEqual(self.methods, ["POST"])
+
+
+class SubmitTest(unittest.TestCase):
+    def test_submits_methods_taking_a_method_keyword(self):
+        client = Client(API_KEY)
+        self.addCleanup(client.close)
+        session = RecordingSession()
+        with mock.patch.object(client._session, 'request', session):
+            future = client.submit(client.integrations.create_custom_api_integration,
+                                   name="Weather", url="https://example.com/weather", method="GET")
+            future.result(timeout=10)
+        body = _json.loads(session.calls[0][2]['data'])
+        self.assertEqual(body['method'], "GET")
+
+
+class ResponseBodyTest(unittest.TestCase):
+    def test_non_json_success_body_raises_api_error(self):
+        client = Client(API_KEY)
+        self.addCleanup(client.close)
+
+        def respond(method, url, **kwargs):
+            response = fake_response(status_code=200)
+            response._content = b"<html>Bad gateway</html>"
+            return response
+
+        with mock.patch.object(client._session, 'request', RecordingSession(respond)):
+            with self.assertRaises(APIError) as raised:
+                client.get("phone_number/list")
+        self.assertEqual(raised.exception.status_code, 200)
+
+
+class WarmupTest(unittest.TestCase):
+    def test_warmup_option_connects_in_the_background(self):
+        connected = threading.Event()
+
+        def head(session, url, **kwargs):
+            connected.set()
+
+        with mock.patch.object(requests.Session, 'head', head):
+            client = Client(API_KEY, warmup=True)
+            self.addCleanup(client.close)
+            self.assertTrue(connected.wait(timeout=10))
+
+    def test_no_warmup_by_default(self):
+        with mock.patch.object(requests.Session, 'head') as head:
+            client = Client(API_KEY)
+            self.addCleanup(client.close)
+        head.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
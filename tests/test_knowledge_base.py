@@ -0,0 +1,60 @@
+import unittest
+from unittest import mock
+
+from omnidimension import APIError, Client
+
+from ._fakes import RecordingSession, fake_response
+
+API_KEY = "test-api-key"
+
+
+class CreateManyTest(unittest.TestCase):
+    def setUp(self):
+        self.client = Client(API_KEY)
+        self.addCleanup(self.client.close)
+        self.session = RecordingSession()
+        patcher = mock.patch.object(self.client._session, 'request', self.session)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_rejects_bad_items_before_uploading(self):
+        bad_batches = [
+            [(b"%PDF", "a.pdf"), (b"%PDF", None)],
+            [(b"%PDF", "a.pdf"), (b"%PDF", 42)],
+            [(b"%PDF", "a.pdf"), (b"%PDF", "notes.txt")],
+            [(b"%PDF", "a.pdf"), b"%PDF"],
+            (b"%PDF", "a.pdf"),
+        ]
+        for files in bad_batches:
+            with self.assertRaises(ValueError):
+                self.client.knowledge_base.create_many(files)
+        self.assertEqual(self.session.calls, [])
+
+    def test_uploads_every_file(self):
+        files = [(b"%PDF-1.4", f"doc{i}.pdf") for i in range(3)]
+        results = self.client.knowledge_base.create_many(files)
+        self.assertEqual(len(results), 3)
+        self.assertEqual(len(self.session.calls), 3)
+
+
+class SyncTest(unittest.TestCase):
+    def test_reports_both_sides_when_one_fails(self):
+        client = Client(API_KEY)
+        self.addCleanup(client.close)
+
+        def respond(method, url, **kwargs):
+            if url.endswith("knowledge_base/attach"):
+                return fake_response({"error": "boom"}, status_code=500)
+            return fake_response({"ok": True})
+
+        session = RecordingSession(respond)
+        with mock.patch.object(client._session, 'request', session):
+            result = client.knowledge_base.sync(7, [1, 2], [2, 3])
+        self.assertEqual(len(session.calls), 2)
+        self.assertIsInstance(result["attached"], APIError)
+        self.assertEqual(result["attached"].status_code, 500)
+        self.assertEqual(result["detached"]["json"], {"ok": True})
+
+
+if __name__ == '__main__':
+    unittest.main()
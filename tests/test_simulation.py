@@ -0,0 +1,40 @@
+import unittest
+from unittest import mock
+
+from omnidimension import Client
+
+from ._fakes import RecordingSession
+
+API_KEY = "test-api-key"
+
+
+class CreateBulkTest(unittest.TestCase):
+    def setUp(self):
+        self.client = Client(API_KEY)
+        self.addCleanup(self.client.close)
+        self.session = RecordingSession()
+        patcher = mock.patch.object(self.client._session, 'request', self.session)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_rejects_bad_spec_keys_before_sending(self):
+        bad_specs = [
+            {"name": "a"},
+            {"agent_id": 1},
+            {"name": "a", "agent_id": 1, "extra": 1},
+            {"name": "a", "agent_id": 1, 3: "x"},
+        ]
+        for spec in bad_specs:
+            with self.assertRaises(ValueError):
+                self.client.simulation.create_bulk([{"name": "ok", "agent_id": 1}, spec])
+        self.assertEqual(self.session.calls, [])
+
+    def test_accepts_every_create_argument(self):
+        spec = {"name": "a", "agent_id": 1, "number_of_call_to_make": 2, "concurrent_call_count": 1,
+                "max_call_duration_in_minutes": 5, "scenarios": None}
+        self.assertEqual(len(self.client.simulation.create_bulk([spec])), 1)
+        self.assertEqual(len(self.session.calls), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,53 @@
+import base64
+import io
+import json
+import unittest
+
+from omnidimension._upload import CHUNK_SIZE, Base64FileBody
+
+
+class ShortReader(io.RawIOBase):
+    """Binary file that never returns more than a few bytes per read."""
+    def __init__(self, data, step=1000):
+        self._data = io.BytesIO(data)
+        self._step = step
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def tell(self):
+        return self._data.tell()
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        return self._data.seek(offset, whence)
+
+    def read(self, size=-1):
+        if size < 0:
+            size = self._step
+        return self._data.read(min(size, self._step))
+
+
+class Base64FileBodyTest(unittest.TestCase):
+    def decode(self, body):
+        raw = b''.join(part.encode() if isinstance(part, str) else part for part in body)
+        self.assertEqual(len(raw), len(body))
+        return json.loads(raw)
+
+    def test_short_reads_encode_the_whole_file(self):
+        data = bytes(range(256)) * (3 * CHUNK_SIZE // 256 + 7)
+        body = Base64FileBody(ShortReader(data), {"filename": "a.pdf"})
+        payload = self.decode(body)
+        self.assertEqual(payload["filename"], "a.pdf")
+        self.assertEqual(base64.b64decode(payload["file"]), data)
+
+    def test_bytes_source(self):
+        data = b"%PDF-1.4 tiny"
+        payload = self.decode(Base64FileBody(data, {"filename": "a.pdf"}))
+        self.assertEqual(base64.b64decode(payload["file"]), data)
+
+
+if __name__ == '__main__':
+    unittest.main()